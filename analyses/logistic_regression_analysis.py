@@ -1,8 +1,10 @@
-import pandas as pd
+import argparse
+import os
+import sys
+import warnings
+
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sys import exit
+import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import (
@@ -10,297 +12,534 @@ from sklearn.metrics import (
     confusion_matrix, classification_report, roc_auc_score, roc_curve
 )
 from sklearn.preprocessing import StandardScaler
-import warnings
-warnings.filterwarnings('ignore')
 
-# Set display options
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', None)
-
-print("="*80)
-print("FOLLOW-UP COMPLETION PREDICTION - LOGISTIC REGRESSION ANALYSIS")
-print("="*80)
+# Shared pipeline helpers live at the project root (one level up from analyses/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pipeline_config import load_config as _load_config  # noqa: E402
 
 # =============================================================================
-# 1. LOAD DATA
+# CONFIGURATION
 # =============================================================================
-print("\n📊 STEP 1: Loading data...")
-
-try:
-    df = pd.read_csv('/Users/maxvargas/Downloads/followup_analysis_data.csv')
-    print(f"✅ Loaded {len(df)} records")
-except FileNotFoundError:
-    print("❌ Error: followup_analysis_data.csv not found!")
-    print("   Export data from BigQuery first.")
-    exit(1)
-
-# =============================================================================
-# 2. EXPLORATORY DATA ANALYSIS
-# =============================================================================
-print("\n📊 STEP 2: Exploratory Data Analysis")
-
-print(f"\nDataset shape: {df.shape}")
-print(f"\nOutcome distribution:")
-print(df['outcome_binary'].value_counts())
-print(f"Completion rate: {df['outcome_binary'].mean():.1%}")
-
-print(f"\nMissing values:")
-print(df.isnull().sum()[df.isnull().sum() > 0])
-
-print(f"\n📈 Completion Rate by Predictor:")
-
-print("\nAge Group:")
-age_stats = df.groupby('age_group')['outcome_binary'].agg(['count', 'mean'])
-age_stats.columns = ['Count', 'Completion Rate']
-age_stats['Completion Rate'] = age_stats['Completion Rate'].apply(lambda x: f"{x:.1%}")
-print(age_stats)
-
-print("\nGender:")
-gender_stats = df.groupby('gender')['outcome_binary'].agg(['count', 'mean'])
-gender_stats.columns = ['Count', 'Completion Rate']
-gender_stats['Completion Rate'] = gender_stats['Completion Rate'].apply(lambda x: f"{x:.1%}")
-print(gender_stats)
-
-print("\nScreening Type:")
-screening_stats = df.groupby('screening_type')['outcome_binary'].agg(['count', 'mean'])
-screening_stats.columns = ['Count', 'Completion Rate']
-screening_stats['Completion Rate'] = screening_stats['Completion Rate'].apply(lambda x: f"{x:.1%}")
-print(screening_stats)
-
-print("\nDay of Week:")
-day_stats = df.groupby('day_of_week_result_delivered')['outcome_binary'].agg(['count', 'mean'])
-day_stats.columns = ['Count', 'Completion Rate']
-day_stats['Completion Rate'] = day_stats['Completion Rate'].apply(lambda x: f"{x:.1%}")
-print(day_stats)
-
-print("\nDays to Result (continuous):")
-print(f"  Mean: {df['days_to_result'].mean():.1f} days")
-print(f"  Median: {df['days_to_result'].median():.1f} days")
-print(f"  Range: {df['days_to_result'].min()}-{df['days_to_result'].max()} days")
-
-# =============================================================================
-# 3. PREPARE FEATURES FOR MODELING
-# =============================================================================
-print("\n🔧 STEP 3: Preparing features for modeling...")
+# Defaults for a single analysis run; override from the 'analysis' section of
+# a YAML config file (see config/pipeline.yml), keyword arguments or CLI flags.
+CONFIG_SECTION = 'analysis'
+
+DEFAULT_CONFIG = {
+    'input_path': 'followup_analysis_data.csv',  # Exported from prep_followup_analysis
+    'output_dir': '.',
+    'test_size': 0.25,  # 75% train, 25% test
+    'random_state': 42,
+    'max_iter': 1000,
+    'risk_tiers_path': 'dbt_project.yml',  # vars.risk_tiers, shared with mart_followup_risk_prediction
+}
 
 # Define feature columns (one-hot encoded predictors)
-feature_columns = [
+FEATURE_COLUMNS = [
     # Age (use 3 dummy variables, drop one to avoid multicollinearity)
     'age_40_49', 'age_50_64', 'age_65_plus',  # Under 40 is baseline
-    
+
     # Gender (use 2 dummy variables)
     'gender_female', 'gender_other',  # Male is baseline
-    
+
     # Screening type (use 4 dummy variables)
     'screening_colonoscopy', 'screening_prostate', 'screening_cervical', 'screening_other',  # Mammogram is baseline
-    
+
     # Days to result (continuous)
     'days_to_result',
-    
+
     # Day of week (use 6 dummy variables)
     'day_tuesday', 'day_wednesday', 'day_thursday', 'day_friday', 'day_saturday', 'day_sunday'  # Monday is baseline
 ]
 
-# Extract features and target
-X = df[feature_columns].copy()
-y = df['outcome_binary'].copy()
+# Segments reported in the EDA stage, mirroring analysis_followup_descriptive
+EDA_SEGMENTS = [
+    ('Age Group', 'age_group'),
+    ('Gender', 'gender'),
+    ('Screening Type', 'screening_type'),
+    ('Day of Week', 'day_of_week_result_delivered'),
+]
+
+# Days-to-result bins (upper bounds, inclusive) and labels used by the dbt model
+DAYS_TO_RESULT_BOUNDS = [7, 14, 21]
+DAYS_TO_RESULT_LABELS = ['≤7 days', '8-14 days', '15-21 days', '>21 days']
+
+
+def load_config(path=None, **overrides):
+    """Build an analysis config from defaults, the 'analysis' config section and overrides."""
+    return _load_config(path, section=CONFIG_SECTION, defaults=DEFAULT_CONFIG, **overrides)
+
+
+def compute_completion_stats(df, outcome='outcome_binary'):
+    """
+    Compute completion counts and rates for every EDA segment in one pass.
+
+    Each predictor column is factorized once and aggregated with np.bincount,
+    avoiding a separate groupby per predictor. Returns a tidy frame with the
+    same segment_type/segment_value schema as analysis_followup_descriptive
+    (including its NULL segment_value rows, e.g. members without an age_group);
+    values are left numeric so formatting only happens at display time.
+    """
+    y = df[outcome].to_numpy(dtype=np.float64)
+    frames = [pd.DataFrame({
+        'segment_type': ['Overall'],
+        'segment_value': ['All Records'],
+        'total_records': [len(y)],
+        'completed': [y.sum()],
+    })]
+
+    # Bin days_to_result exactly like the CASE expression in the dbt model
+    # (NULLs fall through to the last bin, as they do in the SQL ELSE branch)
+    day_bins = np.searchsorted(DAYS_TO_RESULT_BOUNDS, df['days_to_result'].to_numpy(dtype=np.float64))
+    segments = [(name, df[col]) for name, col in EDA_SEGMENTS]
+    segments.append(('Days to Result', pd.Categorical.from_codes(day_bins, DAYS_TO_RESULT_LABELS)))
+
+    for segment_type, values in segments:
+        # Nulls get their own code, like the NULL group of the SQL GROUP BY
+        codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=False)
+        counts = np.bincount(codes, minlength=len(uniques))
+        completed = np.bincount(codes, weights=y, minlength=len(uniques))
+        frames.append(pd.DataFrame({
+            'segment_type': segment_type,
+            'segment_value': np.asarray(uniques, dtype=object),
+            'total_records': counts,
+            'completed': completed,
+        }))
+
+    stats = pd.concat(frames, ignore_index=True)
+    stats['completed'] = stats['completed'].astype(np.int64)
+    stats['completion_rate_pct'] = stats['completed'] / stats['total_records'] * 100
+    return stats
+
+
+def format_completion_stats(stats):
+    """Format a completion stats frame for display (rates as percentages)."""
+    display = stats[['segment_value', 'total_records', 'completion_rate_pct']].copy()
+    display.columns = ['Segment', 'Count', 'Completion Rate']
+    display['Completion Rate'] = display['Completion Rate'].map('{:.1f}%'.format)
+    return display
+
+
+# =============================================================================
+# 1. LOAD DATA
+# =============================================================================
+
+def load_data(path):
+    """Load the exported follow-up analysis data; raises FileNotFoundError if missing."""
+    df = pd.read_csv(path)
+    print(f"✅ Loaded {len(df)} records")
+    return df
+
+# =============================================================================
+# 2. EXPLORATORY DATA ANALYSIS
+# =============================================================================
+
+def run_eda(df):
+    """Print exploratory statistics and return the tidy completion stats frame."""
+    print(f"\nDataset shape: {df.shape}")
+    print(f"\nOutcome distribution:")
+    print(df['outcome_binary'].value_counts())
+    print(f"Completion rate: {df['outcome_binary'].mean():.1%}")
+
+    missing_counts = df.isnull().sum()
+    print(f"\nMissing values:")
+    print(missing_counts[missing_counts > 0])
+
+    print(f"\n📈 Completion Rate by Predictor:")
+
+    eda_stats = compute_completion_stats(df)
+    for segment_type, segment in eda_stats.groupby('segment_type', sort=False):
+        print(f"\n{segment_type}:")
+        print(format_completion_stats(segment).to_string(index=False))
 
-print(f"✅ Features prepared: {X.shape[1]} predictors")
-print(f"   Feature names: {', '.join(feature_columns)}")
+    print("\nDays to Result (continuous):")
+    print(f"  Mean: {df['days_to_result'].mean():.1f} days")
+    print(f"  Median: {df['days_to_result'].median():.1f} days")
+    print(f"  Range: {df['days_to_result'].min()}-{df['days_to_result'].max()} days")
+
+    return eda_stats
+
+# =============================================================================
+# 3. PREPARE FEATURES FOR MODELING
+# =============================================================================
+
+def prepare_features(df):
+    """Extract the feature matrix and target; missing feature values are filled with 0."""
+    X = df[FEATURE_COLUMNS].copy()
+    y = df['outcome_binary'].copy()
+
+    print(f"✅ Features prepared: {X.shape[1]} predictors")
+    print(f"   Feature names: {', '.join(FEATURE_COLUMNS)}")
+
+    # Check for missing values
+    missing_total = X.isnull().sum().sum()
+    if missing_total > 0:
+        print(f"⚠️  Warning: {missing_total} missing values detected")
+        X = X.fillna(0)
+
+    return X, y
 
-# Check for missing values
-if X.isnull().sum().sum() > 0:
-    print(f"⚠️  Warning: {X.isnull().sum().sum()} missing values detected")
-    X = X.fillna(0)
-    
 # =============================================================================
 # 4. TRAIN/TEST SPLIT
 # =============================================================================
-print("\n✂️  STEP 4: Splitting data into train/test sets...")
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, 
-    test_size=0.25,  # 75% train, 25% test
-    random_state=42,
-    stratify=y  # Maintain outcome distribution in both sets
-)
+def split_data(X, y, config):
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y,
+        test_size=config['test_size'],
+        random_state=config['random_state'],
+        stratify=y  # Maintain outcome distribution in both sets
+    )
 
-print(f"✅ Train set: {len(X_train)} records ({len(X_train)/len(X)*100:.1f}%)")
-print(f"✅ Test set:  {len(X_test)} records ({len(X_test)/len(X)*100:.1f}%)")
-print(f"\nTrain outcome distribution:")
-print(f"  Completed: {y_train.sum()} ({y_train.mean():.1%})")
-print(f"  Not completed: {(~y_train.astype(bool)).sum()} ({(1-y_train.mean()):.1%})")
+    print(f"✅ Train set: {len(X_train)} records ({len(X_train)/len(X)*100:.1f}%)")
+    print(f"✅ Test set:  {len(X_test)} records ({len(X_test)/len(X)*100:.1f}%)")
+    print(f"\nTrain outcome distribution:")
+    print(f"  Completed: {y_train.sum()} ({y_train.mean():.1%})")
+    print(f"  Not completed: {(~y_train.astype(bool)).sum()} ({(1-y_train.mean()):.1%})")
+
+    return X_train, X_test, y_train, y_test
 
 # =============================================================================
 # 5. SCALE CONTINUOUS FEATURES
 # =============================================================================
-print("\n📏 STEP 5: Scaling continuous features...")
 
-# Only scale days_to_result (continuous variable)
-scaler = StandardScaler()
-X_train_scaled = X_train.copy()
-X_test_scaled = X_test.copy()
+def scale_features(X_train, X_test):
+    """Scale days_to_result (the only continuous variable); returns (scaler, train, test)."""
+    scaler = StandardScaler()
+    X_train_scaled = X_train.copy()
+    X_test_scaled = X_test.copy()
+
+    X_train_scaled['days_to_result'] = scaler.fit_transform(X_train[['days_to_result']])
+    X_test_scaled['days_to_result'] = scaler.transform(X_test[['days_to_result']])
 
-X_train_scaled['days_to_result'] = scaler.fit_transform(X_train[['days_to_result']])
-X_test_scaled['days_to_result'] = scaler.transform(X_test[['days_to_result']])
+    print(f"✅ Scaled 'days_to_result' (mean=0, std=1)")
 
-print(f"✅ Scaled 'days_to_result' (mean=0, std=1)")
+    return scaler, X_train_scaled, X_test_scaled
 
 # =============================================================================
 # 6. FIT LOGISTIC REGRESSION MODEL
 # =============================================================================
-print("\n🤖 STEP 6: Fitting logistic regression model...")
 
-# Fit model
-model = LogisticRegression(
-    random_state=42,
-    max_iter=1000,
-    solver='lbfgs'
-)
+def fit_model(X_train_scaled, y_train, config):
+    model = LogisticRegression(
+        random_state=config['random_state'],
+        max_iter=config['max_iter'],
+        solver='lbfgs'
+    )
 
-model.fit(X_train_scaled, y_train)
+    model.fit(X_train_scaled, y_train)
 
-print(f"✅ Model trained successfully")
-print(f"   Intercept: {model.intercept_[0]:.4f}")
-print(f"   Number of iterations: {model.n_iter_[0]}")
+    print(f"✅ Model trained successfully")
+    print(f"   Intercept: {model.intercept_[0]:.4f}")
+    print(f"   Number of iterations: {model.n_iter_[0]}")
+
+    return model
 
 # =============================================================================
 # 7. MODEL COEFFICIENTS & INTERPRETATION
 # =============================================================================
-print("\n📊 STEP 7: Model Coefficients (Feature Importance)")
 
-# Create coefficient dataframe
-coef_df = pd.DataFrame({
-    'Feature': feature_columns,
-    'Coefficient': model.coef_[0],
-    'Odds Ratio': np.exp(model.coef_[0])
-})
+def coefficient_table(model):
+    """Return model coefficients and odds ratios sorted by absolute coefficient."""
+    coef_df = pd.DataFrame({
+        'Feature': FEATURE_COLUMNS,
+        'Coefficient': model.coef_[0],
+        'Odds Ratio': np.exp(model.coef_[0])
+    })
+
+    coef_df['Abs_Coefficient'] = np.abs(coef_df['Coefficient'])
+    coef_df = coef_df.sort_values('Abs_Coefficient', ascending=False)
 
-coef_df['Abs_Coefficient'] = np.abs(coef_df['Coefficient'])
-coef_df = coef_df.sort_values('Abs_Coefficient', ascending=False)
+    print("\nTop 10 Most Important Features:")
+    print(coef_df[['Feature', 'Coefficient', 'Odds Ratio']].head(10).to_string(index=False))
 
-print("\nTop 10 Most Important Features:")
-print(coef_df[['Feature', 'Coefficient', 'Odds Ratio']].head(10).to_string(index=False))
+    print("\n📖 Interpretation Guide:")
+    print("  - Positive coefficient = increases likelihood of follow-up completion")
+    print("  - Negative coefficient = decreases likelihood of follow-up completion")
+    print("  - Odds Ratio > 1 = increases odds")
+    print("  - Odds Ratio < 1 = decreases odds")
 
-print("\n📖 Interpretation Guide:")
-print("  - Positive coefficient = increases likelihood of follow-up completion")
-print("  - Negative coefficient = decreases likelihood of follow-up completion")
-print("  - Odds Ratio > 1 = increases odds")
-print("  - Odds Ratio < 1 = decreases odds")
+    return coef_df
 
 # =============================================================================
 # 8. PREDICTIONS & EVALUATION
 # =============================================================================
-print("\n🎯 STEP 8: Making predictions and evaluating model...")
-
-# Predict on test set
-y_pred = model.predict(X_test_scaled)
-y_pred_proba = model.predict_proba(X_test_scaled)[:, 1]
-
-# Calculate metrics
-accuracy = accuracy_score(y_test, y_pred)
-precision = precision_score(y_test, y_pred)
-recall = recall_score(y_test, y_pred)
-f1 = f1_score(y_test, y_pred)
-roc_auc = roc_auc_score(y_test, y_pred_proba)
-
-print("\n📊 MODEL PERFORMANCE (Test Set):")
-print(f"  Accuracy:  {accuracy:.3f}")
-print(f"  Precision: {precision:.3f} (of predicted completions, {precision:.1%} actually completed)")
-print(f"  Recall:    {recall:.3f} (of actual completions, {recall:.1%} were predicted)")
-print(f"  F1-Score:  {f1:.3f}")
-print(f"  ROC-AUC:   {roc_auc:.3f}")
-
-# Confusion matrix
-cm = confusion_matrix(y_test, y_pred)
-print("\n📊 Confusion Matrix:")
-print(f"                 Predicted No  Predicted Yes")
-print(f"  Actual No:     {cm[0,0]:12d}  {cm[0,1]:13d}")
-print(f"  Actual Yes:    {cm[1,0]:12d}  {cm[1,1]:13d}")
-
-# Classification report
-print("\n📊 Detailed Classification Report:")
-print(classification_report(y_test, y_pred, target_names=['Not Completed', 'Completed']))
+
+def evaluate_model(model, X_test_scaled, y_test):
+    """Evaluate the model on the test set and return a dict of metrics."""
+    y_pred = model.predict(X_test_scaled)
+    y_pred_proba = model.predict_proba(X_test_scaled)[:, 1]
+
+    metrics = {
+        'accuracy': accuracy_score(y_test, y_pred),
+        'precision': precision_score(y_test, y_pred),
+        'recall': recall_score(y_test, y_pred),
+        'f1': f1_score(y_test, y_pred),
+        'roc_auc': roc_auc_score(y_test, y_pred_proba),
+    }
+
+    print("\n📊 MODEL PERFORMANCE (Test Set):")
+    print(f"  Accuracy:  {metrics['accuracy']:.3f}")
+    print(f"  Precision: {metrics['precision']:.3f} (of predicted completions, {metrics['precision']:.1%} actually completed)")
+    print(f"  Recall:    {metrics['recall']:.3f} (of actual completions, {metrics['recall']:.1%} were predicted)")
+    print(f"  F1-Score:  {metrics['f1']:.3f}")
+    print(f"  ROC-AUC:   {metrics['roc_auc']:.3f}")
+
+    # Confusion matrix
+    cm = confusion_matrix(y_test, y_pred)
+    print("\n📊 Confusion Matrix:")
+    print(f"                 Predicted No  Predicted Yes")
+    print(f"  Actual No:     {cm[0,0]:12d}  {cm[0,1]:13d}")
+    print(f"  Actual Yes:    {cm[1,0]:12d}  {cm[1,1]:13d}")
+
+    # Classification report
+    print("\n📊 Detailed Classification Report:")
+    print(classification_report(y_test, y_pred, target_names=['Not Completed', 'Completed']))
+
+    return metrics
 
 # =============================================================================
 # 9. RISK SCORING
 # =============================================================================
-print("\n🎲 STEP 9: Generating risk scores...")
-
-# Add predictions to full dataset
-X_scaled_full = X.copy()
-X_scaled_full['days_to_result'] = scaler.transform(X[['days_to_result']])
-
-df['predicted_completion_probability'] = model.predict_proba(X_scaled_full)[:, 1]
-df['predicted_outcome'] = model.predict(X_scaled_full)
-
-# Create risk categories
-df['risk_category'] = pd.cut(
-    df['predicted_completion_probability'],
-    bins=[0, 0.4, 0.7, 1.0],
-    labels=['High Risk (Low Completion Likelihood)', 
-            'Medium Risk (Moderate Completion Likelihood)', 
-            'Low Risk (High Completion Likelihood)']
-)
+# Tier thresholds and labels come from vars.risk_tiers in dbt_project.yml, the
+# same spec the risk_tier_case macro turns into the SQL CASE for
+# mart_followup_risk_prediction. A probability p is in tier i when
+# thresholds[i-1] <= p < thresholds[i], i.e. np.searchsorted(..., side='right').
+
+def load_risk_tiers(path):
+    """Read the risk tier spec (vars.risk_tiers) from a dbt_project.yml."""
+    import yaml  # Installed alongside dbt
+
+    with open(path) as f:
+        tiers = ((yaml.safe_load(f) or {}).get('vars') or {}).get('risk_tiers')
+    if not tiers:
+        raise ValueError(f"No vars.risk_tiers found in {path}")
+    return tiers
 
-print("\n📊 Risk Distribution:")
-print(df['risk_category'].value_counts().sort_index())
 
-print("\n📊 Actual Completion Rate by Risk Category:")
-risk_analysis = df.groupby('risk_category')['outcome_binary'].agg(['count', 'mean'])
-risk_analysis.columns = ['Count', 'Actual Completion Rate']
-risk_analysis['Actual Completion Rate'] = risk_analysis['Actual Completion Rate'].apply(lambda x: f"{x:.1%}")
-print(risk_analysis)
+def risk_tier_spec(tiers, employer_id=None):
+    """Return the default tier spec merged with any override for employer_id."""
+    spec = dict(tiers['default'])
+    if employer_id is not None:
+        spec.update((tiers.get('clients') or {}).get(employer_id) or {})
+
+    thresholds = np.asarray(spec['thresholds'], dtype=float)
+    if np.any(np.diff(thresholds) <= 0):
+        raise ValueError("risk_tiers thresholds must be strictly increasing")
+    for label in ('risk_category', 'outreach_priority'):
+        if len(spec[label]) != len(thresholds) + 1:
+            raise ValueError(f"risk_tiers {label} needs one label per tier ({len(thresholds) + 1})")
+
+    return spec
+
+
+def assign_risk_tiers(probabilities, thresholds, labels):
+    """Vectorized tiering: label of the tier each probability falls in (NaN stays None)."""
+    probabilities = np.asarray(probabilities, dtype=float)
+    tiers = np.asarray(labels, dtype=object)[np.searchsorted(thresholds, probabilities, side='right')]
+    tiers[np.isnan(probabilities)] = None
+    return tiers
+
+
+def tier_records(df, tiers, label='risk_category', probability='predicted_completion_probability'):
+    """
+    Tier every row of df, applying per-client overrides by employer_id when present.
+
+    Returns a Categorical ordered from the highest-risk tier down.
+    """
+    clients = tiers.get('clients') or {}
+    default = risk_tier_spec(tiers)
+
+    values = assign_risk_tiers(df[probability], default['thresholds'], default[label])
+    categories = list(default[label])
+
+    if clients and 'employer_id' in df:
+        employer_ids = df['employer_id'].to_numpy()
+        for employer_id in clients:
+            spec = risk_tier_spec(tiers, employer_id)
+            mask = employer_ids == employer_id
+            values[mask] = assign_risk_tiers(df.loc[mask, probability], spec['thresholds'], spec[label])
+            categories += [value for value in spec[label] if value not in categories]
+
+    return pd.Categorical(values, categories=categories)
+
+
+def score_records(df, X, model, scaler, tiers):
+    """Add predicted probability, predicted outcome and risk category columns to df."""
+    X_scaled_full = X.copy()
+    X_scaled_full['days_to_result'] = scaler.transform(X[['days_to_result']])
+
+    df['predicted_completion_probability'] = model.predict_proba(X_scaled_full)[:, 1]
+    df['predicted_outcome'] = model.predict(X_scaled_full)
+
+    # Create risk categories
+    df['risk_category'] = tier_records(df, tiers)
+
+    print("\n📊 Risk Distribution:")
+    print(df['risk_category'].value_counts().sort_index())
+
+    print("\n📊 Actual Completion Rate by Risk Category:")
+    risk_analysis = df.groupby('risk_category')['outcome_binary'].agg(['count', 'mean'])
+    risk_analysis.columns = ['Count', 'Actual Completion Rate']
+    risk_analysis['Actual Completion Rate'] = risk_analysis['Actual Completion Rate'].apply(lambda x: f"{x:.1%}")
+    print(risk_analysis)
+
+    return df
 
 # =============================================================================
 # 10. SAVE RESULTS
 # =============================================================================
-print("\n💾 STEP 10: Saving results...")
-
-# Save predictions
-df[['screening_id', 'outcome_binary', 'predicted_completion_probability', 
-    'predicted_outcome', 'risk_category']].to_csv('followup_predictions.csv', index=False)
-print("✅ Saved predictions to: followup_predictions.csv")
-
-# Save coefficients
-coef_df.to_csv('model_coefficients.csv', index=False)
-print("✅ Saved coefficients to: model_coefficients.csv")
-
-# Save model summary
-with open('model_summary.txt', 'w') as f:
-    f.write("LOGISTIC REGRESSION MODEL SUMMARY\n")
-    f.write("="*80 + "\n\n")
-    f.write(f"Dataset Size: {len(df)} follow-up records\n")
-    f.write(f"Train/Test Split: 75%/25%\n")
-    f.write(f"Number of Features: {len(feature_columns)}\n\n")
-    f.write("MODEL PERFORMANCE (Test Set):\n")
-    f.write(f"  Accuracy:  {accuracy:.3f}\n")
-    f.write(f"  Precision: {precision:.3f}\n")
-    f.write(f"  Recall:    {recall:.3f}\n")
-    f.write(f"  F1-Score:  {f1:.3f}\n")
-    f.write(f"  ROC-AUC:   {roc_auc:.3f}\n\n")
-    f.write("TOP 5 MOST IMPORTANT FEATURES:\n")
-    for idx, row in coef_df.head(5).iterrows():
-        f.write(f"  {row['Feature']}: {row['Coefficient']:.4f} (OR: {row['Odds Ratio']:.3f})\n")
-
-print("✅ Saved model summary to: model_summary.txt")
+
+def save_results(df, coef_df, metrics, config):
+    """Write predictions, coefficients and the model summary to config['output_dir']."""
+    output_dir = config['output_dir']
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Save predictions
+    predictions_path = os.path.join(output_dir, 'followup_predictions.csv')
+    df[['screening_id', 'outcome_binary', 'predicted_completion_probability',
+        'predicted_outcome', 'risk_category']].to_csv(predictions_path, index=False)
+    print(f"✅ Saved predictions to: {predictions_path}")
+
+    # Save coefficients
+    coefficients_path = os.path.join(output_dir, 'model_coefficients.csv')
+    coef_df.to_csv(coefficients_path, index=False)
+    print(f"✅ Saved coefficients to: {coefficients_path}")
+
+    # Save model summary
+    train_pct = round((1 - config['test_size']) * 100)
+    summary_path = os.path.join(output_dir, 'model_summary.txt')
+    with open(summary_path, 'w') as f:
+        f.write("LOGISTIC REGRESSION MODEL SUMMARY\n")
+        f.write("="*80 + "\n\n")
+        f.write(f"Dataset Size: {len(df)} follow-up records\n")
+        f.write(f"Train/Test Split: {train_pct}%/{100 - train_pct}%\n")
+        f.write(f"Number of Features: {len(FEATURE_COLUMNS)}\n\n")
+        f.write("MODEL PERFORMANCE (Test Set):\n")
+        f.write(f"  Accuracy:  {metrics['accuracy']:.3f}\n")
+        f.write(f"  Precision: {metrics['precision']:.3f}\n")
+        f.write(f"  Recall:    {metrics['recall']:.3f}\n")
+        f.write(f"  F1-Score:  {metrics['f1']:.3f}\n")
+        f.write(f"  ROC-AUC:   {metrics['roc_auc']:.3f}\n\n")
+        f.write("TOP 5 MOST IMPORTANT FEATURES:\n")
+        for idx, row in coef_df.head(5).iterrows():
+            f.write(f"  {row['Feature']}: {row['Coefficient']:.4f} (OR: {row['Odds Ratio']:.3f})\n")
+
+    print(f"✅ Saved model summary to: {summary_path}")
 
 # =============================================================================
-# FINAL SUMMARY
+# PIPELINE
 # =============================================================================
-print("\n" + "="*80)
-print("✅ ANALYSIS COMPLETE!")
-print("="*80)
-print("\n📁 Generated Files:")
-print("  1. followup_predictions.csv - Predictions for all records")
-print("  2. model_coefficients.csv - Feature coefficients and odds ratios")
-print("  3. model_summary.txt - Model performance summary")
-print("\n📊 Key Findings:")
-print(f"  - Model Accuracy: {accuracy:.1%}")
-print(f"  - ROC-AUC Score: {roc_auc:.3f}")
-print(f"  - {(df['risk_category'] == 'High Risk (Low Completion Likelihood)').sum()} members identified as high risk for non-completion")
-print("\n💡 Next Steps:")
-print("  - Review model_coefficients.csv to understand feature impact")
-print("  - Use followup_predictions.csv to prioritize outreach to high-risk members")
-print("  - Load predictions back into BigQuery for operational use")
-print("="*80)
\ No newline at end of file
+
+def run_analysis(config=None, df=None):
+    """
+    Run the full analysis for one configuration.
+
+    Pass df to analyze an in-memory frame instead of reading config['input_path'].
+    Returns a dict with the scored frame, EDA stats, coefficients, metrics, model
+    and the risk tier spec.
+    """
+    config = load_config(**(config or {}))
+
+    print("="*80)
+    print("FOLLOW-UP COMPLETION PREDICTION - LOGISTIC REGRESSION ANALYSIS")
+    print("="*80)
+
+    print("\n📊 STEP 1: Loading data...")
+    if df is None:
+        df = load_data(config['input_path'])
+
+    print("\n📊 STEP 2: Exploratory Data Analysis")
+    eda_stats = run_eda(df)
+
+    print("\n🔧 STEP 3: Preparing features for modeling...")
+    X, y = prepare_features(df)
+
+    print("\n✂️  STEP 4: Splitting data into train/test sets...")
+    X_train, X_test, y_train, y_test = split_data(X, y, config)
+
+    print("\n📏 STEP 5: Scaling continuous features...")
+    scaler, X_train_scaled, X_test_scaled = scale_features(X_train, X_test)
+
+    print("\n🤖 STEP 6: Fitting logistic regression model...")
+    model = fit_model(X_train_scaled, y_train, config)
+
+    print("\n📊 STEP 7: Model Coefficients (Feature Importance)")
+    coef_df = coefficient_table(model)
+
+    print("\n🎯 STEP 8: Making predictions and evaluating model...")
+    metrics = evaluate_model(model, X_test_scaled, y_test)
+
+    print("\n🎲 STEP 9: Generating risk scores...")
+    tiers = load_risk_tiers(config['risk_tiers_path'])
+    df = score_records(df, X, model, scaler, tiers)
+
+    print("\n💾 STEP 10: Saving results...")
+    save_results(df, coef_df, metrics, config)
+
+    return {
+        'scored': df,
+        'eda_stats': eda_stats,
+        'coefficients': coef_df,
+        'metrics': metrics,
+        'model': model,
+        'risk_tiers': tiers,
+    }
+
+
+def print_summary(results):
+    df = results['scored']
+    metrics = results['metrics']
+
+    print("\n" + "="*80)
+    print("✅ ANALYSIS COMPLETE!")
+    print("="*80)
+    print("\n📁 Generated Files:")
+    print("  1. followup_predictions.csv - Predictions for all records")
+    print("  2. model_coefficients.csv - Feature coefficients and odds ratios")
+    print("  3. model_summary.txt - Model performance summary")
+    print("\n📊 Key Findings:")
+    print(f"  - Model Accuracy: {metrics['accuracy']:.1%}")
+    print(f"  - ROC-AUC Score: {metrics['roc_auc']:.3f}")
+    high_risk = risk_tier_spec(results['risk_tiers'])['risk_category'][0]
+    print(f"  - {(df['risk_category'] == high_risk).sum()} members identified as high risk for non-completion")
+    print("\n💡 Next Steps:")
+    print("  - Review model_coefficients.csv to understand feature impact")
+    print("  - Use followup_predictions.csv to prioritize outreach to high-risk members")
+    print("  - Load predictions back into BigQuery for operational use")
+    print("="*80)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fit the follow-up completion logistic regression model.")
+    parser.add_argument('--config', help="YAML config file (reads the 'analysis' section)")
+    parser.add_argument('--input-path', help="CSV export of prep_followup_analysis")
+    parser.add_argument('--output-dir')
+    parser.add_argument('--test-size', type=float)
+    parser.add_argument('--random-state', type=int)
+    parser.add_argument('--max-iter', type=int)
+    parser.add_argument('--risk-tiers-path', help="dbt_project.yml holding vars.risk_tiers")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = vars(parse_args(argv))
+    config = load_config(args.pop('config'), **args)
+
+    warnings.filterwarnings('ignore')
+
+    # Set display options
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', None)
+
+    if not os.path.exists(config['input_path']):
+        print(f"❌ Error: {config['input_path']} not found!")
+        print("   Export data from BigQuery first.")
+        return 1
+
+    results = run_analysis(config)
+    print_summary(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,55 +1,78 @@
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+import argparse
 import random
+import shutil
+import sys
 
-# Set seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+import numpy as np
+import pandas as pd
 
-print("Expanding screenings data from 60 to 560 rows...")
+from pipeline_config import load_config as _load_config
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
-EXISTING_SCREENINGS = 60  # Keep first 60 unchanged
-NEW_SCREENINGS = 500      # Add 500 more
-TOTAL_SCREENINGS = 560
+# Defaults for a single expansion run; override from the 'expand' section of a
+# YAML config file (see config/pipeline.yml), keyword arguments or CLI flags.
+CONFIG_SECTION = 'expand'
+
+DEFAULT_CONFIG = {
+    'seed': 42,
+    'new_screenings': 500,
+    'start_date': '2023-01-01',
+    'end_date': '2025-03-31',
+    # Target: 75% of new screenings need follow-up (abnormal or cancer)
+    'followup_rate': 0.75,
+    # Seeds that new screenings are sampled from
+    'members_path': 'seeds/raw_members.csv',
+    'enrollments_path': 'seeds/raw_enrollments.csv',
+    'providers_path': 'seeds/raw_providers.csv',
+    'input_path': 'seeds/raw_screenings.csv',
+    'output_path': 'seeds/raw_screenings.csv',
+    'backup_path': 'seeds/raw_screenings_backup.csv',
+}
+
+
+def load_config(path=None, **overrides):
+    """Build an expansion config from defaults, the 'expand' config section and overrides."""
+    return _load_config(path, section=CONFIG_SECTION, defaults=DEFAULT_CONFIG, **overrides)
 
-START_DATE = datetime(2023, 1, 1)
-END_DATE = datetime(2025, 3, 31)
-
-# Target: 75% of new screenings need follow-up (abnormal or cancer)
-FOLLOWUP_RATE = 0.75
-
-# =============================================================================
-# LOAD EXISTING SCREENINGS
-# =============================================================================
-
-try:
-    existing_df = pd.read_csv('seeds/raw_screenings.csv')
-    print(f"\n✅ Loaded {len(existing_df)} existing screenings from seeds/raw_screenings.csv")
-    
-    # Get max screening_id to continue numbering
-    max_screening_num = int(existing_df['screening_id'].str.replace('SCR', '').max())
-    print(f"   Last screening ID: SCR{str(max_screening_num).zfill(6)}")
-    
-except FileNotFoundError:
-    print("\n❌ Error: seeds/raw_screenings.csv not found!")
-    print("   Make sure you're running this from the project root directory.")
-    exit(1)
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+AGE_GROUP_BOUNDS = [40, 50, 65]
+AGE_GROUP_LABELS = np.array(['Under 40', '40-49', '50-64', '65+'])
+
+# Days to result mixture: 60% fast, 30% moderate, 10% slow (low inclusive, high exclusive)
+DAYS_TO_RESULT_BUCKETS = {
+    'p': [0.60, 0.30, 0.10],
+    'low': np.array([7, 15, 22]),
+    'high': np.array([15, 22, 45]),
+}
+
+# Cost varies by screening type
+COST_RANGES = {
+    'Mammogram': (400, 500),
+    'Colonoscopy': (1000, 1400),
+    'Prostate Screening': (250, 350),
+    'Cervical Screening': (200, 300),
+    'General Health Screening': (150, 250)
+}
+
 def calculate_followup_probability(age_group, gender, screening_type, days_to_result, day_of_week):
     """
     Calculate probability of follow-up completion based on features.
     Based on healthcare research patterns.
+
+    Vectorized: accepts equal-length arrays (or scalars) and returns a float array.
     """
-    prob = 0.75  # Base completion rate
-    
+    age_group, gender, screening_type, days_to_result, day_of_week = (
+        np.atleast_1d(np.asarray(x)) for x in (age_group, gender, screening_type, days_to_result, day_of_week)
+    )
+
+    prob = np.full(len(days_to_result), 0.75)  # Base completion rate
+
     # Age effect: Older patients more compliant
     age_effects = {
         'Under 40': -0.15,
@@ -57,15 +80,11 @@ def calculate_followup_probability(age_group, gender, screening_type, days_to_re
         '50-64': 0.05,
         '65+': 0.10
     }
-    # Extract age from screening context (approximate)
-    prob += age_effects.get(age_group, 0)
-    
+    prob += pd.Series(age_group).map(age_effects).fillna(0).to_numpy()
+
     # Gender effect: Women slightly more compliant
-    if gender == 'F':
-        prob += 0.05
-    elif gender == 'M':
-        prob -= 0.03
-    
+    prob += np.select([gender == 'F', gender == 'M'], [0.05, -0.03], default=0.0)
+
     # Screening type effect
     screening_effects = {
         'Mammogram': 0.08,
@@ -73,219 +92,306 @@ def calculate_followup_probability(age_group, gender, screening_type, days_to_re
         'Prostate Screening': 0.00,
         'Cervical Screening': 0.03
     }
-    prob += screening_effects.get(screening_type, 0)
-    
+    prob += pd.Series(screening_type).map(screening_effects).fillna(0).to_numpy()
+
     # Days to result effect
-    if days_to_result <= 7:
-        prob += 0.15
-    elif days_to_result <= 14:
-        prob += 0.05
-    elif days_to_result > 21:
-        prob -= 0.10
-    
-    # Day of week effect
-    if day_of_week in ['Monday', 'Tuesday', 'Wednesday', 'Thursday']:
-        prob += 0.05
-    elif day_of_week == 'Friday':
-        prob += 0.00
-    else:  # Weekend
-        prob -= 0.08
-    
+    prob += np.select(
+        [days_to_result <= 7, days_to_result <= 14, days_to_result > 21],
+        [0.15, 0.05, -0.10],
+        default=0.0
+    )
+
+    # Day of week effect (weekdays boost, Friday neutral, weekend penalty)
+    prob += np.select(
+        [np.isin(day_of_week, ['Monday', 'Tuesday', 'Wednesday', 'Thursday']), day_of_week == 'Friday'],
+        [0.05, 0.00],
+        default=-0.08
+    )
+
     # Keep probability within bounds
-    prob = max(0.2, min(0.95, prob))
-    
-    return prob
+    return np.clip(prob, 0.2, 0.95)
 
 def assign_screening_type_by_demographics(age, gender):
-    """Assign realistic screening type based on age/gender"""
-    if gender == 'F' and age >= 40:
-        return np.random.choice(
-            ['Mammogram', 'Colonoscopy', 'Cervical Screening'],
-            p=[0.60, 0.30, 0.10]
-        )
-    elif gender == 'M' and age >= 50:
-        return np.random.choice(
-            ['Colonoscopy', 'Prostate Screening'],
-            p=[0.65, 0.35]
-        )
-    elif age >= 50:
-        return 'Colonoscopy'
-    else:
-        return np.random.choice(
-            ['Cervical Screening', 'General Health Screening'],
-            p=[0.70, 0.30]
-        )
+    """Assign realistic screening types based on age/gender (vectorized over arrays)."""
+    age = np.asarray(age)
+    gender = np.asarray(gender)
+    screening_type = np.empty(age.shape, dtype=object)
+
+    women_40_plus = (gender == 'F') & (age >= 40)
+    men_50_plus = (gender == 'M') & (age >= 50)
+    other_50_plus = ~women_40_plus & ~men_50_plus & (age >= 50)
+    younger = ~women_40_plus & ~men_50_plus & ~other_50_plus
+
+    screening_type[women_40_plus] = np.random.choice(
+        ['Mammogram', 'Colonoscopy', 'Cervical Screening'],
+        women_40_plus.sum(),
+        p=[0.60, 0.30, 0.10]
+    )
+    screening_type[men_50_plus] = np.random.choice(
+        ['Colonoscopy', 'Prostate Screening'],
+        men_50_plus.sum(),
+        p=[0.65, 0.35]
+    )
+    screening_type[other_50_plus] = 'Colonoscopy'
+    screening_type[younger] = np.random.choice(
+        ['Cervical Screening', 'General Health Screening'],
+        younger.sum(),
+        p=[0.70, 0.30]
+    )
+
+    return screening_type
+
+# =============================================================================
+# LOAD EXISTING DATA
+# =============================================================================
+
+def load_screenings(path):
+    """Load the existing screenings seed; raises FileNotFoundError if missing."""
+    existing_df = pd.read_csv(path)
+    print(f"\n✅ Loaded {len(existing_df)} existing screenings from {path}")
+    return existing_df
+
+def load_reference_data(config):
+    """
+    Load the member, enrollment and provider seeds once into keyed arrays.
+
+    Each enrollment row is joined to its member so that a sampled index yields a
+    member_id with its real employer_id, enrollment_date, date_of_birth and
+    gender. The returned dict can be reused across expansion runs.
+    """
+    members = pd.read_csv(
+        config['members_path'],
+        usecols=['member_id', 'date_of_birth', 'gender'],
+        parse_dates=['date_of_birth']
+    )
+    enrollments = pd.read_csv(
+        config['enrollments_path'],
+        usecols=['member_id', 'employer_id', 'enrollment_date'],
+        parse_dates=['enrollment_date']
+    )
+    providers = pd.read_csv(config['providers_path'], usecols=['provider_id'])
+
+    enrolled = enrollments.merge(members, on='member_id', how='inner', validate='many_to_one')
+    print(f"✅ Loaded {len(enrolled)} enrolled members and {len(providers)} providers from seeds")
+
+    return {
+        'member_id': enrolled['member_id'].to_numpy(dtype=object),
+        'employer_id': enrolled['employer_id'].to_numpy(dtype=object),
+        'enrollment_date': enrolled['enrollment_date'].to_numpy(dtype='datetime64[D]'),
+        'date_of_birth': enrolled['date_of_birth'].to_numpy(dtype='datetime64[D]'),
+        'gender': enrolled['gender'].to_numpy(dtype=object),
+        'provider_id': providers['provider_id'].to_numpy(dtype=object),
+    }
 
 # =============================================================================
 # GENERATE NEW SCREENINGS
 # =============================================================================
 
-print(f"\n📊 Generating {NEW_SCREENINGS} new screenings...")
+def generate_new_screenings(config, start_screening_num, reference):
+    """
+    Generate config['new_screenings'] rows numbered after start_screening_num.
 
-new_screenings = []
+    Screenings are sampled from enrolled members in `reference` and dated on or
+    after the member's enrollment date, so every row joins to raw_members,
+    raw_enrollments (same employer) and raw_providers.
+    """
+    num_screenings = config['new_screenings']
+    start_date = np.datetime64(pd.Timestamp(config['start_date']).date(), 'D')
+    end_date = np.datetime64(pd.Timestamp(config['end_date']).date(), 'D')
 
-# Use existing member_ids (MEM00001-MEM00100)
-member_ids = [f'MEM{str(i).zfill(5)}' for i in range(1, 101)]
+    print(f"\n📊 Generating {num_screenings} new screenings...")
 
-# Use existing employer_ids (EMP001-EMP010)
-employer_ids = [f'EMP{str(i).zfill(3)}' for i in range(1, 11)]
+    # Only members enrolled before the end of the window can be screened
+    window_start = np.maximum(reference['enrollment_date'], start_date)
+    window_days = (end_date - window_start).astype(np.int64)
+    eligible = np.flatnonzero(window_days > 0)
+    if len(eligible) == 0:
+        raise ValueError(f"No members enrolled before end_date {config['end_date']}")
 
-# Use existing provider_ids (PROV0001-PROV0010)
-provider_ids = [f'PROV{str(i).zfill(4)}' for i in range(1, 11)]
+    idx = np.random.choice(eligible, num_screenings)
+    provider_id = np.random.choice(reference['provider_id'], num_screenings)
 
-# Generate age groups for members (approximate based on member_id pattern)
-# We'll simulate ages for the purposes of screening assignment
-member_ages = {}
-for member_id in member_ids:
-    member_ages[member_id] = {
-        'age': np.random.choice([35, 42, 48, 55, 62, 70], p=[0.10, 0.20, 0.20, 0.25, 0.15, 0.10]),
-        'gender': np.random.choice(['M', 'F', 'Other'], p=[0.48, 0.50, 0.02])
-    }
+    # Screening date uniformly within the member's enrollment window
+    screening_date = window_start[idx] + (np.random.random(num_screenings) * window_days[idx]).astype('timedelta64[D]')
+
+    # Demographics at time of screening
+    gender = reference['gender'][idx]
+    age = ((screening_date - reference['date_of_birth'][idx]).astype(np.int64) // 365.25).astype(np.int64)
+    age_group = AGE_GROUP_LABELS[np.searchsorted(AGE_GROUP_BOUNDS, age, side='right')]
 
-for i in range(NEW_SCREENINGS):
-    screening_id = f'SCR{str(max_screening_num + i + 1).zfill(6)}'
-    member_id = np.random.choice(member_ids)
-    employer_id = np.random.choice(employer_ids)
-    provider_id = np.random.choice(provider_ids)
-    
-    # Get member demographics
-    age = member_ages[member_id]['age']
-    gender = member_ages[member_id]['gender']
-    age_group = (
-        'Under 40' if age < 40 else
-        '40-49' if age < 50 else
-        '50-64' if age < 65 else
-        '65+'
-    )
-    
     # Assign screening type based on demographics
     screening_type = assign_screening_type_by_demographics(age, gender)
-    
-    # Generate screening date
-    screening_date = START_DATE + timedelta(days=np.random.randint(0, (END_DATE - START_DATE).days))
-    
+
     # Days to result (7-21 days typical)
-    days_to_result = int(np.random.choice(
-        np.concatenate([
-            np.random.randint(7, 15, 60),   # 60% fast
-            np.random.randint(15, 22, 30),  # 30% moderate
-            np.random.randint(22, 45, 10)   # 10% slow
-        ])
-    ))
-    
-    result_date = screening_date + timedelta(days=days_to_result)
-    day_of_week = result_date.strftime('%A')
-    
-    # Result distribution: 75% need follow-up (abnormal or cancer)
-    needs_followup = np.random.random() < FOLLOWUP_RATE
-    
-    if needs_followup:
-        # 90% abnormal-benign, 10% cancer detected
-        result = np.random.choice(
-            ['Abnormal - Benign', 'Cancer Detected'],
-            p=[0.90, 0.10]
-        )
-        follow_up_needed = True
-        
-        # Calculate follow-up completion probability
-        completion_prob = calculate_followup_probability(
-            age_group, gender, screening_type, days_to_result, day_of_week
-        )
-        follow_up_completed = np.random.random() < completion_prob
-    else:
-        result = 'Normal'
-        follow_up_needed = False
-        follow_up_completed = None
-    
-    # Cost varies by screening type
-    cost_ranges = {
-        'Mammogram': (400, 500),
-        'Colonoscopy': (1000, 1400),
-        'Prostate Screening': (250, 350),
-        'Cervical Screening': (200, 300),
-        'General Health Screening': (150, 250)
-    }
-    cost_range = cost_ranges.get(screening_type, (200, 500))
-    cost = np.random.randint(cost_range[0], cost_range[1])
-    
-    new_screenings.append({
-        'screening_id': screening_id,
-        'member_id': member_id,
-        'employer_id': employer_id,
+    bucket = np.random.choice(len(DAYS_TO_RESULT_BUCKETS['p']), num_screenings, p=DAYS_TO_RESULT_BUCKETS['p'])
+    days_to_result = np.random.randint(DAYS_TO_RESULT_BUCKETS['low'][bucket], DAYS_TO_RESULT_BUCKETS['high'][bucket])
+
+    result_date = screening_date + days_to_result.astype('timedelta64[D]')
+    day_of_week = pd.DatetimeIndex(result_date).day_name().to_numpy()
+
+    # Result distribution: 75% need follow-up (abnormal or cancer), of which
+    # 90% abnormal-benign and 10% cancer detected
+    follow_up_needed = np.random.random(num_screenings) < config['followup_rate']
+    result = np.where(
+        follow_up_needed,
+        np.random.choice(['Abnormal - Benign', 'Cancer Detected'], num_screenings, p=[0.90, 0.10]),
+        'Normal'
+    )
+
+    # Follow-up completion only applies to screenings needing follow-up
+    completion_prob = calculate_followup_probability(
+        age_group, gender, screening_type, days_to_result, day_of_week
+    )
+    completed = np.random.random(num_screenings) < completion_prob
+    follow_up_completed = np.where(follow_up_needed, completed, None)
+
+    cost_low = pd.Series(screening_type).map({k: v[0] for k, v in COST_RANGES.items()}).fillna(200)
+    cost_high = pd.Series(screening_type).map({k: v[1] for k, v in COST_RANGES.items()}).fillna(500)
+    cost = np.random.randint(cost_low.to_numpy(dtype=np.int64), cost_high.to_numpy(dtype=np.int64))
+
+    screening_num = pd.Series(np.arange(start_screening_num + 1, start_screening_num + num_screenings + 1))
+
+    return pd.DataFrame({
+        'screening_id': 'SCR' + screening_num.astype(str).str.zfill(6),
+        'member_id': reference['member_id'][idx],
+        'employer_id': reference['employer_id'][idx],
         'provider_id': provider_id,
         'screening_type': screening_type,
-        'screening_date': screening_date.strftime('%Y-%m-%d'),
+        'screening_date': np.datetime_as_string(screening_date, unit='D'),
         'result': result,
-        'result_date': result_date.strftime('%Y-%m-%d'),
+        'result_date': np.datetime_as_string(result_date, unit='D'),
         'follow_up_needed': follow_up_needed,
         'follow_up_completed': follow_up_completed,
         'cost': cost
     })
 
-new_df = pd.DataFrame(new_screenings)
-
 # =============================================================================
 # COMBINE EXISTING + NEW SCREENINGS
 # =============================================================================
 
-# Ensure column order matches
-column_order = existing_df.columns.tolist()
-new_df = new_df[column_order]
+def expand_screenings(existing_df, config=None, reference=None):
+    """
+    Append newly generated screenings to existing_df.
+
+    Reseeds the global RNGs from config['seed']. Pass `reference` (from
+    load_reference_data) to reuse already-loaded seeds across runs.
+    Returns (expanded_df, new_df).
+    """
+    config = load_config(**(config or {}))
+
+    np.random.seed(config['seed'])
+    random.seed(config['seed'])
+
+    if reference is None:
+        reference = load_reference_data(config)
 
-# Combine
-expanded_df = pd.concat([existing_df, new_df], ignore_index=True)
+    # Get max screening_id to continue numbering
+    max_screening_num = int(existing_df['screening_id'].str.replace('SCR', '').max())
+    print(f"   Last screening ID: SCR{str(max_screening_num).zfill(6)}")
+
+    new_df = generate_new_screenings(config, max_screening_num, reference)
 
-print(f"\n✅ Combined datasets:")
-print(f"   Existing screenings: {len(existing_df)}")
-print(f"   New screenings:      {len(new_df)}")
-print(f"   Total screenings:    {len(expanded_df)}")
+    # Ensure column order matches
+    column_order = existing_df.columns.tolist()
+    new_df = new_df[column_order]
+
+    # Combine
+    expanded_df = pd.concat([existing_df, new_df], ignore_index=True)
+
+    print(f"\n✅ Combined datasets:")
+    print(f"   Existing screenings: {len(existing_df)}")
+    print(f"   New screenings:      {len(new_df)}")
+    print(f"   Total screenings:    {len(expanded_df)}")
+
+    return expanded_df, new_df
 
 # =============================================================================
 # SAVE EXPANDED FILE
 # =============================================================================
 
-# Backup original file
-import shutil
-shutil.copy('seeds/raw_screenings.csv', 'seeds/raw_screenings_backup.csv')
-print(f"\n💾 Backed up original to: seeds/raw_screenings_backup.csv")
+def save_screenings(expanded_df, config):
+    """Back up the input file (if configured) and write the expanded screenings."""
+    if config['backup_path']:
+        shutil.copy(config['input_path'], config['backup_path'])
+        print(f"\n💾 Backed up original to: {config['backup_path']}")
 
-# Save expanded file
-expanded_df.to_csv('seeds/raw_screenings.csv', index=False)
-print(f"✅ Saved expanded file to: seeds/raw_screenings.csv")
+    expanded_df.to_csv(config['output_path'], index=False)
+    print(f"✅ Saved expanded file to: {config['output_path']}")
 
 # =============================================================================
 # SUMMARY STATISTICS
 # =============================================================================
 
-print("\n" + "="*60)
-print("SCREENING DATA EXPANSION COMPLETE!")
-print("="*60)
-
-print(f"\n📊 Result Distribution (All {len(expanded_df)} screenings):")
-result_counts = expanded_df['result'].value_counts()
-for result, count in result_counts.items():
-    pct = count / len(expanded_df) * 100
-    print(f"  {result}: {count} ({pct:.1f}%)")
-
-print(f"\n📊 Follow-Up Analysis (New {len(new_df)} screenings only):")
-new_followup_needed = new_df['follow_up_needed'].sum()
-new_followup_completed = new_df[new_df['follow_up_needed'] == True]['follow_up_completed'].sum()
-print(f"  Screenings needing follow-up:  {new_followup_needed} ({new_followup_needed/len(new_df)*100:.1f}%)")
-print(f"  Follow-ups completed:          {new_followup_completed} ({new_followup_completed/new_followup_needed*100:.1f}%)")
-
-print(f"\n📊 Overall Follow-Up Analysis (All {len(expanded_df)} screenings):")
-total_followup_needed = expanded_df['follow_up_needed'].sum()
-total_followup_completed = expanded_df[expanded_df['follow_up_needed'] == True]['follow_up_completed'].sum()
-print(f"  Screenings needing follow-up:  {total_followup_needed}")
-print(f"  Follow-ups completed:          {total_followup_completed}")
-print(f"  Follow-up completion rate:     {total_followup_completed/total_followup_needed*100:.1f}%")
-
-print(f"\n📊 Screening Type Distribution:")
-print(expanded_df['screening_type'].value_counts())
-
-print("\n" + "="*60)
-print("NEXT STEPS:")
-print("  1. Run: dbt seed --select raw_screenings --full-refresh")
-print("  2. Run: dbt run --select staging core marts")
-print("  3. Verify expanded data in BigQuery")
-print("="*60)
\ No newline at end of file
+def print_summary(expanded_df, new_df):
+    print("\n" + "="*60)
+    print("SCREENING DATA EXPANSION COMPLETE!")
+    print("="*60)
+
+    print(f"\n📊 Result Distribution (All {len(expanded_df)} screenings):")
+    result_counts = expanded_df['result'].value_counts()
+    for result, count in result_counts.items():
+        pct = count / len(expanded_df) * 100
+        print(f"  {result}: {count} ({pct:.1f}%)")
+
+    print(f"\n📊 Follow-Up Analysis (New {len(new_df)} screenings only):")
+    new_followup_needed = new_df['follow_up_needed'].sum()
+    new_followup_completed = new_df[new_df['follow_up_needed'] == True]['follow_up_completed'].sum()
+    print(f"  Screenings needing follow-up:  {new_followup_needed} ({new_followup_needed/len(new_df)*100:.1f}%)")
+    print(f"  Follow-ups completed:          {new_followup_completed} ({new_followup_completed/new_followup_needed*100:.1f}%)")
+
+    print(f"\n📊 Overall Follow-Up Analysis (All {len(expanded_df)} screenings):")
+    total_followup_needed = expanded_df['follow_up_needed'].sum()
+    total_followup_completed = expanded_df[expanded_df['follow_up_needed'] == True]['follow_up_completed'].sum()
+    print(f"  Screenings needing follow-up:  {total_followup_needed}")
+    print(f"  Follow-ups completed:          {total_followup_completed}")
+    print(f"  Follow-up completion rate:     {total_followup_completed/total_followup_needed*100:.1f}%")
+
+    print(f"\n📊 Screening Type Distribution:")
+    print(expanded_df['screening_type'].value_counts())
+
+    print("\n" + "="*60)
+    print("NEXT STEPS:")
+    print("  1. Run: dbt seed --select raw_screenings --full-refresh")
+    print("  2. Run: dbt run --select staging core marts")
+    print("  3. Verify expanded data in BigQuery")
+    print("="*60)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Append synthetic screenings to the screenings seed.")
+    parser.add_argument('--config', help="YAML config file (reads the 'expand' section)")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--new-screenings', type=int)
+    parser.add_argument('--start-date')
+    parser.add_argument('--end-date')
+    parser.add_argument('--followup-rate', type=float)
+    parser.add_argument('--members-path')
+    parser.add_argument('--enrollments-path')
+    parser.add_argument('--providers-path')
+    parser.add_argument('--input-path')
+    parser.add_argument('--output-path')
+    parser.add_argument('--backup-path', help="Pass an empty string to skip the backup")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = vars(parse_args(argv))
+    config = load_config(args.pop('config'), **args)
+
+    try:
+        existing_df = load_screenings(config['input_path'])
+        reference = load_reference_data(config)
+    except FileNotFoundError as error:
+        print(f"\n❌ Error: {error.filename or error} not found!")
+        print("   Make sure you're running this from the project root directory.")
+        return 1
+
+    print(f"Expanding screenings data by {config['new_screenings']} rows...")
+    expanded_df, new_df = expand_screenings(existing_df, config, reference=reference)
+    save_screenings(expanded_df, config)
+    print_summary(expanded_df, new_df)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,114 +1,250 @@
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+import argparse
+import os
 import random
+import sys
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from pipeline_config import load_config as _load_config
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+# Defaults for a single generator run. Any key can be overridden from the
+# 'generate' section of a YAML config file (see config/pipeline.yml) or by
+# keyword arguments / CLI flags, so scale variants can run in one process.
+CONFIG_SECTION = 'generate'
+
+DEFAULT_CONFIG = {
+    'seed': 42,
+    'num_employers': 10,
+    'num_members': 1000,
+    'num_providers': 50,
+    'start_date': '2023-01-01',
+    'end_date': '2025-11-13',
+    'enrollment_end_date': '2024-12-31',
+    'reference_date': '2025-11-13',  # "Today" for member ages, so runs are reproducible
+    'workload_profile': 'uniform',  # See WORKLOAD_PROFILES
+    'output_dir': 'seeds',
+    'output_format': 'csv',
+}
+
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+# Calendar-date columns (DATE in seeds/seeds.yml); written as YYYY-MM-DD in CSV
+# and date32 in Parquet so `dbt seed` and load_fixtures.py load them without a cast
+DATE_COLUMNS = ['contract_start_date', 'date_of_birth', 'created_at', 'enrollment_date',
+                'screening_date', 'result_date', 'claim_date', 'service_date']
+
+INDUSTRIES = ['Technology', 'Healthcare', 'Manufacturing', 'Retail', 'Finance',
+              'Education', 'Government', 'Hospitality', 'Construction', 'Legal']
+
+STATES = ['CA', 'NY', 'TX', 'FL', 'IL', 'WA', 'MA']
+
+# =============================================================================
+# WORKLOAD PROFILES
+# =============================================================================
+# Distribution presets for benchmarks and incremental-model tests:
+# - key_distribution: how employer_id (members), provider_id (screenings) and
+#   screenings per member are drawn. 'zipf' gives a few dominant employers,
+#   high-volume providers and very active members (hot keys).
+# - date_distribution: 'seasonal' shapes screening dates with SEASONAL_MONTH_WEIGHTS.
+# - late_arrivals: 'bursty' delays whole batches (feed outages) instead of
+#   scattering late result dates uniformly.
+WORKLOAD_PROFILES = {
+    'uniform': {'key_distribution': 'uniform', 'date_distribution': 'uniform', 'late_arrivals': 'uniform'},
+    'zipf': {'key_distribution': 'zipf', 'date_distribution': 'uniform', 'late_arrivals': 'uniform'},
+    'seasonal': {'key_distribution': 'uniform', 'date_distribution': 'seasonal', 'late_arrivals': 'uniform'},
+    'bursty': {'key_distribution': 'uniform', 'date_distribution': 'uniform', 'late_arrivals': 'bursty'},
+    'realistic': {'key_distribution': 'zipf', 'date_distribution': 'seasonal', 'late_arrivals': 'bursty'},
+}
+
+ZIPF_EXPONENT = 1.1
+
+# Relative screening volume by month (Jan-Dec): peaks for colorectal awareness
+# (Mar), breast cancer awareness (Oct) and met-deductible year end, summer dip
+SEASONAL_MONTH_WEIGHTS = np.array([0.90, 0.95, 1.15, 1.00, 0.95, 0.80, 0.70, 0.80, 0.95, 1.35, 1.15, 1.20])
+
+# Late-arriving results: share of screenings delayed, and for bursty delivery
+# the screening-date window covered by each delayed batch
+LATE_ARRIVAL_RATE = 0.05
+LATE_BURST_WINDOW_DAYS = 7
+
+
+def load_config(path=None, **overrides):
+    """Build a generator config from defaults, the 'generate' config section and overrides."""
+    return _load_config(path, section=CONFIG_SECTION, defaults=DEFAULT_CONFIG, **overrides)
+
+
+def get_workload_profile(name):
+    """Return the distribution settings for a named workload profile."""
+    try:
+        return WORKLOAD_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"workload_profile must be one of {sorted(WORKLOAD_PROFILES)}, got {name!r}") from None
+
+
+def key_weights(num_keys, profile):
+    """
+    Sampling weights for num_keys keys under a workload profile.
+
+    Returns None for uniform draws (so np.random.choice keeps its uniform code
+    path) or Zipf weights where the first key is the hottest.
+    """
+    if profile['key_distribution'] == 'uniform':
+        return None
 
-# Set seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+    weights = 1.0 / np.arange(1, num_keys + 1) ** ZIPF_EXPONENT
+    return weights / weights.sum()
 
-# Configuration
-NUM_EMPLOYERS = 10
-NUM_MEMBERS = 1000
-NUM_PROVIDERS = 50
-START_DATE = datetime(2023, 1, 1)
-END_DATE = datetime(2025, 11, 13)
 
-print("Generating synthetic cancer screening data...")
+def member_activity(num_members, profile):
+    """
+    Per-member multipliers for the number of screenings (mean 1).
 
-# ============================================================================
+    Returns None for uniform draws, or Zipf weights shuffled across members so
+    hot members are spread over employers rather than all being the first ones.
+    """
+    weights = key_weights(num_members, profile)
+    if weights is None:
+        return None
+    return np.random.permutation(weights * num_members)
+
+
+def write_tables(tables, output_dir, output_format='csv'):
+    """Write each non-empty table to <output_dir>/<name>.<format> and return the paths."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}, got {output_format!r}")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+    for name, table in tables.items():
+        if table.empty:
+            continue
+        path = os.path.join(output_dir, f'{name}.{output_format}')
+        dates = {column: pd.to_datetime(table[column]).dt.date for column in DATE_COLUMNS if column in table}
+        table = table.assign(**dates)
+        if output_format == 'parquet':
+            table.to_parquet(path, index=False)
+        else:
+            table.to_csv(path, index=False)
+        paths.append(path)
+
+    return paths
+
+
+# =============================================================================
 # 1. EMPLOYERS
-# ============================================================================
-print("Generating employers...")
+# =============================================================================
 
-industries = ['Technology', 'Healthcare', 'Manufacturing', 'Retail', 'Finance', 
-              'Education', 'Government', 'Hospitality', 'Construction', 'Legal']
-              
-employers = pd.DataFrame({
-    'employer_id': [f'EMP{str(i).zfill(3)}' for i in range(1, NUM_EMPLOYERS + 1)],
-    'employer_name': [f'{industries[i]} Corp {chr(65+i)}' for i in range(NUM_EMPLOYERS)],
-    'industry': industries[:NUM_EMPLOYERS],
-    'employee_count': np.random.choice([500, 1000, 2500, 5000, 10000], NUM_EMPLOYERS),
-    'state': np.random.choice(['CA', 'NY', 'TX', 'FL', 'IL', 'WA', 'MA'], NUM_EMPLOYERS),
-    'contract_start_date': pd.date_range(start='2022-01-01', periods=NUM_EMPLOYERS, freq='30D')
-})
-
-# ============================================================================
+def generate_employers(config):
+    """Generate employer (client organization) records."""
+    num_employers = config['num_employers']
+
+    return pd.DataFrame({
+        'employer_id': [f'EMP{str(i).zfill(3)}' for i in range(1, num_employers + 1)],
+        'employer_name': [f'{INDUSTRIES[i % len(INDUSTRIES)]} Corp {chr(65 + i % 26)}' for i in range(num_employers)],
+        'industry': [INDUSTRIES[i % len(INDUSTRIES)] for i in range(num_employers)],
+        'employee_count': np.random.choice([500, 1000, 2500, 5000, 10000], num_employers),
+        'state': np.random.choice(STATES, num_employers),
+        'contract_start_date': pd.date_range(start='2022-01-01', periods=num_employers, freq='30D')
+    })
+
+
+# =============================================================================
 # 2. MEMBERS (Patients)
-# ============================================================================
-print("Generating members...")
-
-# Age distribution: weighted toward screening-eligible ages (40-75)
-ages = np.concatenate([
-    np.random.randint(25, 40, 200),  # Younger adults
-    np.random.randint(40, 65, 600),  # Primary screening age
-    np.random.randint(65, 80, 200)   # Older adults
-])
-
-birth_dates = [datetime.now() - timedelta(days=age*365.25) for age in ages]
-
-members = pd.DataFrame({
-    'member_id': [f'MEM{str(i).zfill(5)}' for i in range(1, NUM_MEMBERS + 1)],
-    'employer_id': np.random.choice(employers['employer_id'], NUM_MEMBERS),
-    'first_name': [f'FirstName{i}' for i in range(1, NUM_MEMBERS + 1)],
-    'last_name': [f'LastName{i}' for i in range(1, NUM_MEMBERS + 1)],
-    'date_of_birth': birth_dates,
-    'gender': np.random.choice(['M', 'F', 'Other'], NUM_MEMBERS, p=[0.48, 0.50, 0.02]),
-    'state': np.random.choice(['CA', 'NY', 'TX', 'FL', 'IL', 'WA', 'MA'], NUM_MEMBERS),
-    'zip_code': [str(np.random.randint(10000, 99999)) for _ in range(NUM_MEMBERS)],
-    'email': [f'member{i}@example.com' for i in range(1, NUM_MEMBERS + 1)],
-    'phone': [f'555-{np.random.randint(100,999)}-{np.random.randint(1000,9999)}' for _ in range(NUM_MEMBERS)],
-    'high_risk_flag': np.random.choice([True, False], NUM_MEMBERS, p=[0.15, 0.85]),  # 15% high risk
-    'created_at': pd.date_range(start='2022-01-01', end='2023-12-31', periods=NUM_MEMBERS)
-})
-
-# Add some nulls for data quality testing (2% missing emails)
-null_indices = np.random.choice(NUM_MEMBERS, int(NUM_MEMBERS * 0.02), replace=False)
-members.loc[null_indices, 'email'] = None
-
-# ============================================================================
+# =============================================================================
+
+def generate_members(config, employers):
+    """Generate member (patient) records with ~2% missing emails."""
+    num_members = config['num_members']
+    profile = get_workload_profile(config['workload_profile'])
+
+    # Age distribution: weighted toward screening-eligible ages (40-75)
+    num_younger = int(num_members * 0.2)
+    num_older = int(num_members * 0.2)
+    ages = np.concatenate([
+        np.random.randint(25, 40, num_younger),                             # Younger adults
+        np.random.randint(40, 65, num_members - num_younger - num_older),   # Primary screening age
+        np.random.randint(65, 80, num_older)                                # Older adults
+    ])
+
+    reference_date = pd.Timestamp(config['reference_date'])
+    birth_dates = [reference_date - timedelta(days=age*365.25) for age in ages]
+
+    members = pd.DataFrame({
+        'member_id': [f'MEM{str(i).zfill(5)}' for i in range(1, num_members + 1)],
+        'employer_id': np.random.choice(employers['employer_id'], num_members, p=key_weights(len(employers), profile)),
+        'first_name': [f'FirstName{i}' for i in range(1, num_members + 1)],
+        'last_name': [f'LastName{i}' for i in range(1, num_members + 1)],
+        'date_of_birth': birth_dates,
+        'gender': np.random.choice(['M', 'F', 'Other'], num_members, p=[0.48, 0.50, 0.02]),
+        'state': np.random.choice(STATES, num_members),
+        'zip_code': [str(np.random.randint(10000, 99999)) for _ in range(num_members)],
+        'email': [f'member{i}@example.com' for i in range(1, num_members + 1)],
+        'phone': [f'555-{np.random.randint(100,999)}-{np.random.randint(1000,9999)}' for _ in range(num_members)],
+        'high_risk_flag': np.random.choice([True, False], num_members, p=[0.15, 0.85]),  # 15% high risk
+        'created_at': pd.date_range(start='2022-01-01', end='2023-12-31', periods=num_members)
+    })
+
+    # Add some nulls for data quality testing (2% missing emails)
+    null_indices = np.random.choice(num_members, int(num_members * 0.02), replace=False)
+    members.loc[null_indices, 'email'] = None
+
+    return members
+
+
+# =============================================================================
 # 3. ENROLLMENTS
-# ============================================================================
-print("Generating enrollments...")
-
-# 95% of members enroll in screening program
-enrolled_members = members.sample(int(NUM_MEMBERS * 0.95))
-
-enrollments = pd.DataFrame({
-    'enrollment_id': [f'ENR{str(i).zfill(5)}' for i in range(1, len(enrolled_members) + 1)],
-    'member_id': enrolled_members['member_id'].values,
-    'employer_id': enrolled_members['employer_id'].values,
-    'enrollment_date': pd.date_range(start=START_DATE, end='2024-12-31', periods=len(enrolled_members)),
-    'enrollment_channel': np.random.choice(['Email', 'Portal', 'Phone', 'HR Event'], len(enrolled_members), p=[0.5, 0.3, 0.15, 0.05]),
-    'status': np.random.choice(['Active', 'Completed', 'Inactive'], len(enrolled_members), p=[0.6, 0.3, 0.1]),
-    'consent_given': True  # All enrolled have consent
-})
-
-# ============================================================================
+# =============================================================================
+
+def generate_enrollments(config, members):
+    """Enroll 95% of members; returns (enrolled_members, enrollments)."""
+    enrolled_members = members.sample(int(len(members) * 0.95))
+
+    enrollments = pd.DataFrame({
+        'enrollment_id': [f'ENR{str(i).zfill(5)}' for i in range(1, len(enrolled_members) + 1)],
+        'member_id': enrolled_members['member_id'].values,
+        'employer_id': enrolled_members['employer_id'].values,
+        'enrollment_date': pd.date_range(start=config['start_date'], end=config['enrollment_end_date'], periods=len(enrolled_members)),
+        'enrollment_channel': np.random.choice(['Email', 'Portal', 'Phone', 'HR Event'], len(enrolled_members), p=[0.5, 0.3, 0.15, 0.05]),
+        'status': np.random.choice(['Active', 'Completed', 'Inactive'], len(enrolled_members), p=[0.6, 0.3, 0.1]),
+        'consent_given': True  # All enrolled have consent
+    })
+
+    return enrolled_members, enrollments
+
+
+# =============================================================================
 # 4. PROVIDERS
-# ============================================================================
-print("Generating providers...")
+# =============================================================================
+
+def generate_providers(config):
+    """Generate healthcare provider records."""
+    num_providers = config['num_providers']
+    specialties = ['Radiology', 'Oncology', 'Primary Care', 'Gastroenterology', 'Pathology']
 
-specialties = ['Radiology', 'Oncology', 'Primary Care', 'Gastroenterology', 'Pathology']
+    return pd.DataFrame({
+        'provider_id': [f'PROV{str(i).zfill(4)}' for i in range(1, num_providers + 1)],
+        'provider_name': [f'Dr. {chr(65 + (i % 26))}. Provider{i}' for i in range(num_providers)],
+        'specialty': np.random.choice(specialties, num_providers),
+        'state': np.random.choice(STATES, num_providers),
+        'npi_number': [f'NPI{np.random.randint(1000000000, 9999999999)}' for _ in range(num_providers)]
+    })
 
-providers = pd.DataFrame({
-    'provider_id': [f'PROV{str(i).zfill(4)}' for i in range(1, NUM_PROVIDERS + 1)],
-    'provider_name': [f'Dr. {chr(65 + (i % 26))}. Provider{i}' for i in range(NUM_PROVIDERS)],
-    'specialty': np.random.choice(specialties, NUM_PROVIDERS),
-    'state': np.random.choice(['CA', 'NY', 'TX', 'FL', 'IL', 'WA', 'MA'], NUM_PROVIDERS),
-    'npi_number': [f'NPI{np.random.randint(1000000000, 9999999999)}' for _ in range(NUM_PROVIDERS)]
-})
 
-# ============================================================================
+# =============================================================================
 # 5. SCREENINGS
-# ============================================================================
-print("Generating screenings...")
+# =============================================================================
 
 # Screening types by age/gender
-def assign_screening_type(row):
-    age = (datetime.now() - row['date_of_birth']).days / 365.25
+def assign_screening_type(row, reference_date):
+    age = (reference_date - row['date_of_birth']).days / 365.25
     gender = row['gender']
-    
+
     if gender == 'F' and age >= 40:
         # Women 40+ eligible for mammogram + colonoscopy
         return np.random.choice(['Mammogram', 'Colonoscopy'], p=[0.7, 0.3])
@@ -122,178 +258,311 @@ def assign_screening_type(row):
         # Younger: cervical or general health screening
         return np.random.choice(['Cervical Screening', 'General Health Screening'])
 
-# Generate 1-5 screenings per enrolled member over 2 years
-screenings_list = []
-screening_id = 1
-
-for _, enrollment in enrollments.iterrows():
-    member = members[members['member_id'] == enrollment['member_id']].iloc[0]
-    
-    # Number of screenings (more engaged members have more)
-    num_screenings = np.random.choice([1, 2, 3, 4, 5], p=[0.4, 0.3, 0.15, 0.10, 0.05])
-    
-    for s in range(num_screenings):
-        screening_date = enrollment['enrollment_date'] + timedelta(days=np.random.randint(30, 730))
-        
-        if screening_date > END_DATE:
-            continue
-            
-        screening_type = assign_screening_type(member)
-        
-        # Results: 90% normal, 8% abnormal, 2% cancer detected
-        result = np.random.choice(['Normal', 'Abnormal - Benign', 'Cancer Detected'], 
-                                   p=[0.90, 0.08, 0.02])
-        
-        screenings_list.append({
-            'screening_id': f'SCR{str(screening_id).zfill(6)}',
-            'member_id': enrollment['member_id'],
-            'employer_id': enrollment['employer_id'],
-            'provider_id': np.random.choice(providers['provider_id']),
-            'screening_type': screening_type,
-            'screening_date': screening_date,
-            'result': result,
-            'result_date': screening_date + timedelta(days=np.random.randint(7, 21)),  # Results in 1-3 weeks
-            'follow_up_needed': result != 'Normal',
-            'follow_up_completed': np.random.choice([True, False], p=[0.75, 0.25]) if result != 'Normal' else None,
-            'cost': np.random.randint(200, 2000)
-        })
-        
-        screening_id += 1
-
-screenings = pd.DataFrame(screenings_list)
-
-# Add some late-arriving data (5% of screenings have result_date in future)
-late_indices = screenings.sample(int(len(screenings) * 0.05)).index
-screenings.loc[late_indices, 'result_date'] = screenings.loc[late_indices, 'result_date'] + timedelta(days=30)
-
-# ============================================================================
+
+def sample_screening_date(enrollment_date, profile):
+    """
+    Draw a screening date 30-730 days after enrollment.
+
+    Under the seasonal date distribution, candidate dates are accepted with
+    probability proportional to SEASONAL_MONTH_WEIGHTS for their month.
+    """
+    screening_date = enrollment_date + timedelta(days=np.random.randint(30, 730))
+
+    if profile['date_distribution'] == 'seasonal':
+        max_weight = SEASONAL_MONTH_WEIGHTS.max()
+        while np.random.random() * max_weight > SEASONAL_MONTH_WEIGHTS[screening_date.month - 1]:
+            screening_date = enrollment_date + timedelta(days=np.random.randint(30, 730))
+
+    return screening_date
+
+
+def apply_late_arrivals(screenings, profile):
+    """
+    Delay result_date for LATE_ARRIVAL_RATE of screenings to simulate late-arriving data.
+
+    'uniform' shifts randomly chosen rows by 30 days. 'bursty' repeatedly picks
+    a LATE_BURST_WINDOW_DAYS screening-date window (e.g. a provider feed outage)
+    and delays the rows in it by one shared lag until the same total is reached.
+    """
+    num_late = int(len(screenings) * LATE_ARRIVAL_RATE)
+
+    if profile['late_arrivals'] == 'uniform':
+        late_indices = screenings.sample(num_late).index
+        screenings.loc[late_indices, 'result_date'] = screenings.loc[late_indices, 'result_date'] + timedelta(days=30)
+        return screenings
+
+    screening_dates = pd.to_datetime(screenings['screening_date'])
+    delayed = pd.Series(False, index=screenings.index)
+    remaining = num_late
+
+    while remaining > 0:
+        burst_start = screening_dates[np.random.choice(screenings.index[~delayed])]
+        in_burst = (screening_dates >= burst_start) & (screening_dates < burst_start + timedelta(days=LATE_BURST_WINDOW_DAYS))
+        burst_indices = screenings.index[in_burst & ~delayed][:remaining]
+        lag = timedelta(days=np.random.randint(14, 61))  # The whole batch lands together
+        screenings.loc[burst_indices, 'result_date'] = screenings.loc[burst_indices, 'result_date'] + lag
+        delayed[burst_indices] = True
+        remaining -= len(burst_indices)
+
+    return screenings
+
+
+def generate_screenings(config, members, enrollments, providers):
+    """
+    Generate 1-5 screenings per enrolled member over 2 years, with ~5% late results.
+
+    Under Zipf key distribution the 1-5 draw is scaled by member_activity, so a
+    few members have many screenings and most have one.
+    """
+    end_date = pd.Timestamp(config['end_date'])
+    reference_date = pd.Timestamp(config['reference_date'])
+    profile = get_workload_profile(config['workload_profile'])
+    provider_weights = key_weights(len(providers), profile)
+    activity = member_activity(len(enrollments), profile)
+
+    screenings_list = []
+    screening_id = 1
+
+    for position, (_, enrollment) in enumerate(enrollments.iterrows()):
+        member = members[members['member_id'] == enrollment['member_id']].iloc[0]
+
+        # Number of screenings (more engaged members have more)
+        num_screenings = np.random.choice([1, 2, 3, 4, 5], p=[0.4, 0.3, 0.15, 0.10, 0.05])
+        if activity is not None:
+            num_screenings = max(1, int(round(num_screenings * activity[position])))
+
+        for s in range(num_screenings):
+            screening_date = sample_screening_date(enrollment['enrollment_date'], profile)
+
+            if screening_date > end_date:
+                continue
+
+            screening_type = assign_screening_type(member, reference_date)
+
+            # Results: 90% normal, 8% abnormal, 2% cancer detected
+            result = np.random.choice(['Normal', 'Abnormal - Benign', 'Cancer Detected'],
+                                       p=[0.90, 0.08, 0.02])
+
+            screenings_list.append({
+                'screening_id': f'SCR{str(screening_id).zfill(6)}',
+                'member_id': enrollment['member_id'],
+                'employer_id': enrollment['employer_id'],
+                'provider_id': np.random.choice(providers['provider_id'], p=provider_weights),
+                'screening_type': screening_type,
+                'screening_date': screening_date,
+                'result': result,
+                'result_date': screening_date + timedelta(days=np.random.randint(7, 21)),  # Results in 1-3 weeks
+                'follow_up_needed': result != 'Normal',
+                'follow_up_completed': np.random.choice([True, False], p=[0.75, 0.25]) if result != 'Normal' else None,
+                'cost': np.random.randint(200, 2000)
+            })
+
+            screening_id += 1
+
+    screenings = pd.DataFrame(screenings_list)
+
+    # Add some late-arriving data (5% of screenings have result_date in future)
+    return apply_late_arrivals(screenings, profile)
+
+
+# =============================================================================
 # 6. CLAIMS (Medical claims for follow-up care)
-# ============================================================================
-print("Generating claims...")
-
-# Generate claims for members with abnormal/cancer results
-abnormal_screenings = screenings[screenings['result'].isin(['Abnormal - Benign', 'Cancer Detected'])]
-
-claims_list = []
-claim_id = 1
-
-for _, screening in abnormal_screenings.iterrows():
-    # 1-3 claims per abnormal screening (imaging, biopsy, consultation)
-    num_claims = np.random.randint(1, 4)
-    
-    for c in range(num_claims):
-        claim_date = screening['result_date'] + timedelta(days=np.random.randint(1, 90))
-        
-        # Procedure types for follow-up
-        if screening['screening_type'] == 'Mammogram':
-            procedures = ['Diagnostic Mammogram', 'Breast Ultrasound', 'Breast Biopsy', 'MRI']
-            icd10_codes = ['C50.9', 'D48.6', 'N60.1']  # Breast cancer, benign neoplasm, fibrocystic
-        elif screening['screening_type'] == 'Colonoscopy':
-            procedures = ['Polypectomy', 'Follow-up Colonoscopy', 'CT Colonography']
-            icd10_codes = ['C18.9', 'D12.6', 'K63.5']  # Colon cancer, polyp, polyp
-        else:
-            procedures = ['Consultation', 'Imaging', 'Biopsy', 'Lab Test']
-            icd10_codes = ['C80.1', 'D48.9', 'R76.0']  # Malignant neoplasm, benign
-        
-        claims_list.append({
-            'claim_id': f'CLM{str(claim_id).zfill(6)}',
-            'member_id': screening['member_id'],
-            'provider_id': screening['provider_id'],
-            'claim_date': claim_date,
-            'service_date': claim_date,
-            'procedure_code': f'CPT{np.random.randint(10000, 99999)}',
-            'procedure_description': np.random.choice(procedures),
-            'diagnosis_code': np.random.choice(icd10_codes),
-            'claim_amount': np.random.randint(500, 5000),
-            'paid_amount': np.random.randint(400, 4500),
-            'claim_status': np.random.choice(['Paid', 'Pending', 'Denied'], p=[0.85, 0.10, 0.05])
-        })
-        
-        claim_id += 1
-
-claims = pd.DataFrame(claims_list) if claims_list else pd.DataFrame()
-
-# ============================================================================
+# =============================================================================
+
+def generate_claims(screenings):
+    """Generate 1-3 follow-up claims for each abnormal/cancer screening."""
+    abnormal_screenings = screenings[screenings['result'].isin(['Abnormal - Benign', 'Cancer Detected'])]
+
+    claims_list = []
+    claim_id = 1
+
+    for _, screening in abnormal_screenings.iterrows():
+        # 1-3 claims per abnormal screening (imaging, biopsy, consultation)
+        num_claims = np.random.randint(1, 4)
+
+        for c in range(num_claims):
+            claim_date = screening['result_date'] + timedelta(days=np.random.randint(1, 90))
+
+            # Procedure types for follow-up
+            if screening['screening_type'] == 'Mammogram':
+                procedures = ['Diagnostic Mammogram', 'Breast Ultrasound', 'Breast Biopsy', 'MRI']
+                icd10_codes = ['C50.9', 'D48.6', 'N60.1']  # Breast cancer, benign neoplasm, fibrocystic
+            elif screening['screening_type'] == 'Colonoscopy':
+                procedures = ['Polypectomy', 'Follow-up Colonoscopy', 'CT Colonography']
+                icd10_codes = ['C18.9', 'D12.6', 'K63.5']  # Colon cancer, polyp, polyp
+            else:
+                procedures = ['Consultation', 'Imaging', 'Biopsy', 'Lab Test']
+                icd10_codes = ['C80.1', 'D48.9', 'R76.0']  # Malignant neoplasm, benign
+
+            claims_list.append({
+                'claim_id': f'CLM{str(claim_id).zfill(6)}',
+                'member_id': screening['member_id'],
+                'provider_id': screening['provider_id'],
+                'claim_date': claim_date,
+                'service_date': claim_date,
+                'procedure_code': f'CPT{np.random.randint(10000, 99999)}',
+                'procedure_description': np.random.choice(procedures),
+                'diagnosis_code': np.random.choice(icd10_codes),
+                'claim_amount': np.random.randint(500, 5000),
+                'paid_amount': np.random.randint(400, 4500),
+                'claim_status': np.random.choice(['Paid', 'Pending', 'Denied'], p=[0.85, 0.10, 0.05])
+            })
+
+            claim_id += 1
+
+    return pd.DataFrame(claims_list) if claims_list else pd.DataFrame()
+
+
+# =============================================================================
 # 7. APP EVENTS (User engagement with Color's portal)
-# ============================================================================
-print("Generating app events...")
-
-event_types = [
-    'login', 'view_results', 'schedule_screening', 'update_profile', 
-    'download_report', 'chat_support', 'view_education_content', 'logout'
-]
-
-app_events_list = []
-event_id = 1
-
-for _, member in enrolled_members.iterrows():
-    # Engagement pattern: 70% active, 20% moderate, 10% low
-    engagement_level = np.random.choice(['high', 'medium', 'low'], p=[0.7, 0.2, 0.1])
-    
-    if engagement_level == 'high':
-        num_events = np.random.randint(20, 100)
-    elif engagement_level == 'medium':
-        num_events = np.random.randint(5, 20)
-    else:
-        num_events = np.random.randint(1, 5)
-    
-    enrollment_date = enrollments[enrollments['member_id'] == member['member_id']]['enrollment_date'].iloc[0]
-    
-    for e in range(num_events):
-        event_date = enrollment_date + timedelta(days=np.random.randint(0, 730))
-        
-        if event_date > END_DATE:
-            continue
-        
-        app_events_list.append({
-            'event_id': f'EVT{str(event_id).zfill(7)}',
-            'member_id': member['member_id'],
-            'event_type': np.random.choice(event_types),
-            'event_timestamp': event_date + timedelta(hours=np.random.randint(0, 24)),
-            'session_id': f'SES{np.random.randint(100000, 999999)}',
-            'device_type': np.random.choice(['Desktop', 'Mobile', 'Tablet'], p=[0.5, 0.4, 0.1])
-        })
-        
-        event_id += 1
-
-app_events = pd.DataFrame(app_events_list)
-
-# ============================================================================
-# SAVE TO CSV
-# ============================================================================
-print("\nSaving CSVs to seeds/...")
-
-# Create seeds directory if it doesn't exist
-import os
-os.makedirs('seeds', exist_ok=True)
-
-employers.to_csv('seeds/raw_employers.csv', index=False)
-members.to_csv('seeds/raw_members.csv', index=False)
-enrollments.to_csv('seeds/raw_enrollments.csv', index=False)
-providers.to_csv('seeds/raw_providers.csv', index=False)
-screenings.to_csv('seeds/raw_screenings.csv', index=False)
-if not claims.empty:
-    claims.to_csv('seeds/raw_claims.csv', index=False)
-app_events.to_csv('seeds/raw_app_events.csv', index=False)
-
-# ============================================================================
-# SUMMARY STATISTICS
-# ============================================================================
-print("\n" + "="*60)
-print("SYNTHETIC DATA GENERATION COMPLETE!")
-print("="*60)
-print(f"\n📊 Data Summary:")
-print(f"  Employers:      {len(employers):,}")
-print(f"  Members:        {len(members):,}")
-print(f"  Enrollments:    {len(enrollments):,}")
-print(f"  Providers:      {len(providers):,}")
-print(f"  Screenings:     {len(screenings):,}")
-print(f"  Claims:         {len(claims):,}")
-print(f"  App Events:     {len(app_events):,}")
-print(f"\n📅 Date Range:    {START_DATE.date()} to {END_DATE.date()}")
-print(f"\n✅ Files saved to seeds/ directory")
-print(f"\nNext steps:")
-print(f"  1. Run: dbt seed")
-print(f"  2. Run: dbt run")
-print(f"  3. Run: dbt test")
-print("="*60)
\ No newline at end of file
+# =============================================================================
+
+def generate_app_events(config, enrolled_members, enrollments):
+    """Generate portal events per enrolled member based on an engagement level."""
+    end_date = pd.Timestamp(config['end_date'])
+
+    event_types = [
+        'login', 'view_results', 'schedule_screening', 'update_profile',
+        'download_report', 'chat_support', 'view_education_content', 'logout'
+    ]
+
+    app_events_list = []
+    event_id = 1
+
+    for _, member in enrolled_members.iterrows():
+        # Engagement pattern: 70% active, 20% moderate, 10% low
+        engagement_level = np.random.choice(['high', 'medium', 'low'], p=[0.7, 0.2, 0.1])
+
+        if engagement_level == 'high':
+            num_events = np.random.randint(20, 100)
+        elif engagement_level == 'medium':
+            num_events = np.random.randint(5, 20)
+        else:
+            num_events = np.random.randint(1, 5)
+
+        enrollment_date = enrollments[enrollments['member_id'] == member['member_id']]['enrollment_date'].iloc[0]
+
+        for e in range(num_events):
+            event_date = enrollment_date + timedelta(days=np.random.randint(0, 730))
+
+            if event_date > end_date:
+                continue
+
+            app_events_list.append({
+                'event_id': f'EVT{str(event_id).zfill(7)}',
+                'member_id': member['member_id'],
+                'event_type': np.random.choice(event_types),
+                'event_timestamp': event_date + timedelta(hours=np.random.randint(0, 24)),
+                'session_id': f'SES{np.random.randint(100000, 999999)}',
+                'device_type': np.random.choice(['Desktop', 'Mobile', 'Tablet'], p=[0.5, 0.4, 0.1])
+            })
+
+            event_id += 1
+
+    return pd.DataFrame(app_events_list)
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+def generate_synthetic_data(config=None):
+    """
+    Generate all synthetic tables for one configuration.
+
+    Reseeds the global RNGs from config['seed'] so repeated calls in the same
+    process are reproducible. Returns a dict of DataFrames keyed by seed name.
+    """
+    config = load_config(**(config or {}))
+
+    np.random.seed(config['seed'])
+    random.seed(config['seed'])
+
+    print("Generating employers...")
+    employers = generate_employers(config)
+
+    print("Generating members...")
+    members = generate_members(config, employers)
+
+    print("Generating enrollments...")
+    enrolled_members, enrollments = generate_enrollments(config, members)
+
+    print("Generating providers...")
+    providers = generate_providers(config)
+
+    print("Generating screenings...")
+    screenings = generate_screenings(config, members, enrollments, providers)
+
+    print("Generating claims...")
+    claims = generate_claims(screenings)
+
+    print("Generating app events...")
+    app_events = generate_app_events(config, enrolled_members, enrollments)
+
+    return {
+        'raw_employers': employers,
+        'raw_members': members,
+        'raw_enrollments': enrollments,
+        'raw_providers': providers,
+        'raw_screenings': screenings,
+        'raw_claims': claims,
+        'raw_app_events': app_events,
+    }
+
+
+def print_summary(tables, config):
+    """Print row counts for the generated tables."""
+    print("\n" + "="*60)
+    print("SYNTHETIC DATA GENERATION COMPLETE!")
+    print("="*60)
+    print(f"\n📊 Data Summary:")
+    print(f"  Employers:      {len(tables['raw_employers']):,}")
+    print(f"  Members:        {len(tables['raw_members']):,}")
+    print(f"  Enrollments:    {len(tables['raw_enrollments']):,}")
+    print(f"  Providers:      {len(tables['raw_providers']):,}")
+    print(f"  Screenings:     {len(tables['raw_screenings']):,}")
+    print(f"  Claims:         {len(tables['raw_claims']):,}")
+    print(f"  App Events:     {len(tables['raw_app_events']):,}")
+    print(f"\n📅 Date Range:    {config['start_date']} to {config['end_date']}")
+    print(f"🎛️  Workload:      {config['workload_profile']}")
+    print(f"\n✅ Files saved to {config['output_dir']}/ directory")
+    print(f"\nNext steps:")
+    print(f"  1. Run: dbt seed")
+    print(f"  2. Run: dbt run")
+    print(f"  3. Run: dbt test")
+    print("="*60)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic cancer screening seed data.")
+    parser.add_argument('--config', help="YAML config file (reads the 'generate' section)")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--num-employers', type=int)
+    parser.add_argument('--num-members', type=int)
+    parser.add_argument('--num-providers', type=int)
+    parser.add_argument('--start-date')
+    parser.add_argument('--end-date')
+    parser.add_argument('--enrollment-end-date')
+    parser.add_argument('--reference-date', help="Date member ages are computed from")
+    parser.add_argument('--workload-profile', choices=sorted(WORKLOAD_PROFILES))
+    parser.add_argument('--output-dir')
+    parser.add_argument('--output-format', choices=OUTPUT_FORMATS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = vars(parse_args(argv))
+    config = load_config(args.pop('config'), **args)
+
+    print("Generating synthetic cancer screening data...")
+    tables = generate_synthetic_data(config)
+
+    print(f"\nSaving {config['output_format'].upper()}s to {config['output_dir']}/...")
+    write_tables(tables, config['output_dir'], config['output_format'])
+
+    print_summary(tables, config)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import argparse
+import io
+import os
+import sys
+import time
+
+import pandas as pd
+
+from pipeline_config import load_config as _load_config
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+# Bulk-loads generated fixtures (CSV or Parquet) straight into the warehouse,
+# bypassing `dbt seed`. Override from the 'load' section of a YAML config file
+# (see config/pipeline.yml), keyword arguments or CLI flags.
+CONFIG_SECTION = 'load'
+
+DEFAULT_CONFIG = {
+    'fixture_dir': 'seeds',
+    'seeds_yml': 'seeds/seeds.yml',  # Source of column_types for every raw table
+    'tables': None,                  # Default: every seed declared in seeds_yml
+    'engine': 'bigquery',            # bigquery | duckdb
+    'project': None,                 # BigQuery project (default: client's project)
+    'dataset': None,                 # Target dataset/schema, e.g. dbt_mvargas_raw
+    'location': None,
+    'duckdb_path': 'cancer_screening.duckdb',
+}
+
+ENGINES = ('bigquery', 'duckdb')
+
+# Seed column_types -> (BigQuery type, DuckDB type, pandas CSV dtype, Arrow type)
+COLUMN_TYPES = {
+    'string': ('STRING', 'VARCHAR', 'string', 'string'),
+    'int64': ('INT64', 'BIGINT', 'Int64', 'int64'),
+    'float64': ('FLOAT64', 'DOUBLE', 'float64', 'float64'),
+    'bool': ('BOOL', 'BOOLEAN', 'boolean', 'bool'),
+    'date': ('DATE', 'DATE', None, 'date32'),
+    'timestamp': ('TIMESTAMP', 'TIMESTAMP', None, 'timestamp[us]'),
+}
+
+
+def load_config(path=None, **overrides):
+    """Build a load config from defaults, the 'load' config section and overrides."""
+    return _load_config(path, section=CONFIG_SECTION, defaults=DEFAULT_CONFIG, **overrides)
+
+
+# =============================================================================
+# 1. SCHEMAS AND FIXTURES
+# =============================================================================
+
+def load_column_types(seeds_yml):
+    """Return {seed_name: {column: type}} from the column_types in seeds.yml."""
+    import yaml  # Installed alongside dbt
+
+    with open(seeds_yml) as f:
+        seeds = (yaml.safe_load(f) or {}).get('seeds') or []
+
+    column_types = {}
+    for seed in seeds:
+        types = {column: type_.lower() for column, type_ in seed['config']['column_types'].items()}
+        unknown = sorted(set(types.values()) - set(COLUMN_TYPES))
+        if unknown:
+            raise ValueError(f"Unsupported column_types for {seed['name']}: {', '.join(unknown)}")
+        column_types[seed['name']] = types
+
+    return column_types
+
+
+def find_fixture(fixture_dir, table):
+    """Return the Parquet or CSV file for a table (Parquet preferred), or None."""
+    for extension in ('parquet', 'csv'):
+        path = os.path.join(fixture_dir, f'{table}.{extension}')
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_csv_fixture(path, column_types):
+    """
+    Read a CSV fixture with the declared types instead of inferring them.
+
+    Dates are truncated to the day so generator output with timestamps still
+    loads into DATE columns.
+    """
+    dtypes = {column: COLUMN_TYPES[type_][2] for column, type_ in column_types.items() if COLUMN_TYPES[type_][2]}
+    temporal = [column for column, type_ in column_types.items() if type_ in ('date', 'timestamp')]
+
+    df = pd.read_csv(path, dtype=dtypes, usecols=list(column_types))
+
+    for column in temporal:
+        parsed = pd.to_datetime(df[column], format='mixed')
+        df[column] = parsed.dt.date if column_types[column] == 'date' else parsed
+
+    return df[list(column_types)]
+
+
+def read_parquet_fixture(path, column_types):
+    """
+    Read a Parquet fixture as an Arrow table cast to the declared types.
+
+    Timestamps are truncated to the day for DATE columns, so Parquet written
+    from datetime64 frames still loads into DATE columns.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, columns=list(column_types))
+    schema = pa.schema([
+        (column, pa.type_for_alias(COLUMN_TYPES[type_][3])) for column, type_ in column_types.items()
+    ])
+    return table.select(list(column_types)).cast(schema, safe=False)
+
+
+def read_fixture(path, column_types):
+    """Read a Parquet (as Arrow) or CSV (as pandas) fixture with the declared types."""
+    if path.endswith('.parquet'):
+        return read_parquet_fixture(path, column_types)
+    return read_csv_fixture(path, column_types)
+
+
+# =============================================================================
+# 2. ENGINES
+# =============================================================================
+
+def load_bigquery(path, table, column_types, config):
+    """Load one fixture into BigQuery with an explicit schema (WRITE_TRUNCATE)."""
+    from google.cloud import bigquery  # Installed with dbt-bigquery
+
+    client = bigquery.Client(project=config['project'], location=config['location'])
+    destination = f"{client.project}.{config['dataset']}.{table}"
+
+    job_config = bigquery.LoadJobConfig(
+        schema=[bigquery.SchemaField(column, COLUMN_TYPES[type_][0]) for column, type_ in column_types.items()],
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+    )
+
+    if path.endswith('.parquet'):
+        # Re-encode with the declared Arrow types; BigQuery won't load a
+        # Parquet TIMESTAMP into a DATE column
+        import pyarrow.parquet as pq
+
+        buffer = io.BytesIO()
+        pq.write_table(read_parquet_fixture(path, column_types), buffer)
+        buffer.seek(0)
+        job_config.source_format = bigquery.SourceFormat.PARQUET
+        job = client.load_table_from_file(buffer, destination, job_config=job_config)
+    else:
+        df = read_csv_fixture(path, column_types)
+        job = client.load_table_from_dataframe(df, destination, job_config=job_config)
+
+    return job.result().output_rows
+
+
+def load_duckdb(path, table, column_types, config, connection):
+    """Create or replace <dataset>.<table> in DuckDB with the declared column types."""
+    schema = config['dataset'] or 'main'
+    connection.execute(f'create schema if not exists {schema}')
+
+    connection.register('fixture', read_fixture(path, column_types))
+    columns = ', '.join(
+        f'cast({column} as {COLUMN_TYPES[type_][1]}) as {column}' for column, type_ in column_types.items()
+    )
+    connection.execute(f'create or replace table {schema}.{table} as select {columns} from fixture')
+    connection.unregister('fixture')
+
+    return connection.execute(f'select count(*) from {schema}.{table}').fetchone()[0]
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+def load_fixtures(config=None):
+    """
+    Bulk-load every fixture found in config['fixture_dir'] into the configured engine.
+
+    Returns a DataFrame with one row per table: file, rows loaded and seconds.
+    """
+    config = load_config(**(config or {}))
+    if config['engine'] not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {config['engine']!r}")
+    if config['engine'] == 'bigquery' and not config['dataset']:
+        raise ValueError("dataset is required for the bigquery engine")
+
+    column_types = load_column_types(config['seeds_yml'])
+    tables = config['tables'] or list(column_types)
+
+    connection = None
+    if config['engine'] == 'duckdb':
+        import duckdb
+
+        connection = duckdb.connect(config['duckdb_path'])
+
+    results = []
+    try:
+        for table in tables:
+            path = find_fixture(config['fixture_dir'], table)
+            if path is None:
+                print(f"⚠️  Skipping {table}: no fixture in {config['fixture_dir']}")
+                continue
+
+            started = time.perf_counter()
+            if config['engine'] == 'bigquery':
+                rows = load_bigquery(path, table, column_types[table], config)
+            else:
+                rows = load_duckdb(path, table, column_types[table], config, connection)
+            elapsed = time.perf_counter() - started
+
+            print(f"✅ Loaded {rows:,} rows into {table} in {elapsed:.1f}s")
+            results.append({'table': table, 'path': path, 'rows': rows, 'seconds': elapsed})
+    finally:
+        if connection is not None:
+            connection.close()
+
+    return pd.DataFrame(results)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load typed fixtures into the warehouse, bypassing dbt seed.")
+    parser.add_argument('--config', help="YAML config file (reads the 'load' section)")
+    parser.add_argument('--fixture-dir')
+    parser.add_argument('--seeds-yml', help="seeds.yml declaring column_types")
+    parser.add_argument('--tables', nargs='+', help="Seed names to load (default: all in seeds.yml)")
+    parser.add_argument('--engine', choices=ENGINES)
+    parser.add_argument('--project')
+    parser.add_argument('--dataset')
+    parser.add_argument('--duckdb-path')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = vars(parse_args(argv))
+    config = load_config(args.pop('config'), **args)
+
+    print(f"Bulk-loading fixtures from {config['fixture_dir']}/ ({config['engine']})...")
+    results = load_fixtures(config)
+    print(f"\n✅ Loaded {results['rows'].sum() if len(results) else 0:,} rows "
+          f"across {len(results)} tables in {results['seconds'].sum() if len(results) else 0:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,22 @@
+{#
+  Surrogate keys are computed once in staging and passed through downstream.
+  var('surrogate_key_type'):
+    'md5'   - 32-char string via dbt_utils (default)
+    'int64' - FARM_FINGERPRINT of the same null-safe, '-'-separated string:
+              8-byte integer keys that are cheaper to hash, store and join on
+  Changing the type requires `dbt run --full-refresh` (fct_screenings is incremental).
+#}
 {% macro generate_surrogate_key(cols) -%}
-  {{ return(dbt_utils.generate_surrogate_key(cols)) }}
-{%- endmacro %}
\ No newline at end of file
+  {%- set key_type = var('surrogate_key_type', 'md5') -%}
+  {%- if key_type == 'md5' -%}
+    {{ return(dbt_utils.generate_surrogate_key(cols)) }}
+  {%- elif key_type == 'int64' -%}
+    {%- set fields = [] -%}
+    {%- for col in cols -%}
+      {%- do fields.append("coalesce(cast(" ~ col ~ " as string), '_dbt_utils_surrogate_key_null_')") -%}
+    {%- endfor -%}
+    {{ return('farm_fingerprint(' ~ (fields | join(" || '-' || ")) ~ ')') }}
+  {%- else -%}
+    {{ exceptions.raise_compiler_error("surrogate_key_type must be 'md5' or 'int64', got '" ~ key_type ~ "'") }}
+  {%- endif -%}
+{%- endmacro %}
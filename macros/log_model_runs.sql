@@ -0,0 +1,110 @@
+{#
+  Run profiling: on-run-start creates <target schema>_meta.meta_model_runs and
+  on-run-end appends one row per executed node with its execution time and the
+  adapter response (rows affected, bytes processed/billed, slot ms), plus whether
+  the invocation ran with --full-refresh and its --select, so full rebuilds of
+  incremental models aren't compared against incremental runs.
+  mart_model_run_trends reads the table through the 'meta' source.
+#}
+
+{% macro model_runs_relation() -%}
+  {{ return(api.Relation.create(
+      database=target.database,
+      schema=target.schema ~ '_meta',
+      identifier='meta_model_runs'
+  )) }}
+{%- endmacro %}
+
+
+{% macro create_model_runs_table() %}
+  {% if execute %}
+    {% set relation = model_runs_relation() %}
+    {% do adapter.create_schema(relation) %}
+    {% do run_query(
+      'create table if not exists ' ~ relation ~ ' (
+          invocation_id string,
+          run_started_at timestamp,
+          target_name string,
+          command string,
+          node_unique_id string,
+          node_name string,
+          resource_type string,
+          materialization string,
+          status string,
+          execution_time_seconds float64,
+          rows_affected int64,
+          bytes_processed int64,
+          bytes_billed int64,
+          slot_ms int64,
+          job_id string,
+          logged_at timestamp,
+          full_refresh bool,
+          selector string
+      )'
+    ) %}
+    {# Tables created before full_refresh / selector were recorded #}
+    {% do run_query(
+      'alter table ' ~ relation ~ '
+          add column if not exists full_refresh bool,
+          add column if not exists selector string'
+    ) %}
+  {% endif %}
+{% endmacro %}
+
+
+{% macro _model_runs_literal(value) -%}
+  {%- if value is none -%}
+    null
+  {%- elif value is number -%}
+    {{ value }}
+  {%- else -%}
+    '{{ value | string | replace("\\", "\\\\") | replace("'", "\\'") }}'
+  {%- endif -%}
+{%- endmacro %}
+
+
+{% macro log_model_runs(results) %}
+  {% if execute and results %}
+    {% set rows = [] %}
+    {% set select_args = invocation_args_dict.get('select') %}
+    {% set selector = (select_args if select_args is string else select_args | join(' ')) if select_args else none %}
+    {% for result in results if result.node.resource_type in ['model', 'seed', 'snapshot'] %}
+      {% set response = result.adapter_response or {} %}
+      {% set values = [
+          target.name,
+          flags.WHICH,
+          result.node.unique_id,
+          result.node.name,
+          result.node.resource_type,
+          result.node.config.materialized,
+          result.status,
+          result.execution_time,
+          response.get('rows_affected'),
+          response.get('bytes_processed'),
+          response.get('bytes_billed'),
+          response.get('slot_ms'),
+          response.get('job_id'),
+      ] %}
+      {% set literals = [] %}
+      {% for value in values %}
+        {% do literals.append(_model_runs_literal(value)) %}
+      {% endfor %}
+      {% do rows.append(
+        "('" ~ invocation_id ~ "', timestamp '" ~ run_started_at.isoformat() ~ "', "
+        ~ literals | join(', ') ~ ', current_timestamp(), '
+        ~ ('true' if flags.FULL_REFRESH else 'false') ~ ', '
+        ~ _model_runs_literal(selector) ~ ')'
+      ) %}
+    {% endfor %}
+
+    {% if rows %}
+      {% do run_query(
+        'insert into ' ~ model_runs_relation() ~ ' (
+            invocation_id, run_started_at, target_name, command, node_unique_id, node_name,
+            resource_type, materialization, status, execution_time_seconds, rows_affected,
+            bytes_processed, bytes_billed, slot_ms, job_id, logged_at, full_refresh, selector
+        ) values\n' ~ rows | join(',\n')
+      ) %}
+    {% endif %}
+  {% endif %}
+{% endmacro %}
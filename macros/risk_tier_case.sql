@@ -0,0 +1,57 @@
+{#
+  Risk tiering from var('risk_tiers') (see dbt_project.yml). The generated CASE
+  matches np.searchsorted(thresholds, p, side='right') in
+  analyses/logistic_regression_analysis.py: p is in tier i when
+  thresholds[i-1] <= p < thresholds[i]; null probabilities stay null.
+#}
+
+{% macro risk_tier_spec(employer_id=none) -%}
+  {%- set tiers = var('risk_tiers') -%}
+  {%- set spec = {} -%}
+  {%- do spec.update(tiers['default']) -%}
+  {%- if employer_id is not none -%}
+    {%- do spec.update((tiers.get('clients') or {}).get(employer_id) or {}) -%}
+  {%- endif -%}
+
+  {%- for label in ['risk_category', 'outreach_priority'] -%}
+    {%- if spec[label] | length != spec['thresholds'] | length + 1 -%}
+      {{ exceptions.raise_compiler_error(
+          "risk_tiers" ~ ("." ~ employer_id if employer_id is not none else "") ~ ": " ~ label
+          ~ " needs one label per tier (" ~ (spec['thresholds'] | length + 1) ~ ")"
+      ) }}
+    {%- endif -%}
+  {%- endfor -%}
+  {%- for i in range(1, spec['thresholds'] | length) -%}
+    {%- if spec['thresholds'][i] <= spec['thresholds'][i - 1] -%}
+      {{ exceptions.raise_compiler_error("risk_tiers thresholds must be strictly increasing") }}
+    {%- endif -%}
+  {%- endfor -%}
+
+  {{ return(spec) }}
+{%- endmacro %}
+
+
+{% macro risk_tier_case_for_spec(probability, spec, label='outreach_priority') -%}
+  case
+    when {{ probability }} is null then null
+    {%- for threshold in spec['thresholds'] %}
+    when {{ probability }} < {{ threshold }} then '{{ spec[label][loop.index0] }}'
+    {%- endfor %}
+    else '{{ spec[label][-1] }}'
+  end
+{%- endmacro %}
+
+
+{% macro risk_tier_case(probability, label='outreach_priority', employer_id=none) -%}
+  {%- set clients = var('risk_tiers').get('clients') or {} -%}
+  {%- if employer_id is not none and clients -%}
+  case {{ employer_id }}
+    {%- for client in clients %}
+    when '{{ client }}' then {{ risk_tier_case_for_spec(probability, risk_tier_spec(client), label) }}
+    {%- endfor %}
+    else {{ risk_tier_case_for_spec(probability, risk_tier_spec(), label) }}
+  end
+  {%- else -%}
+  {{ risk_tier_case_for_spec(probability, risk_tier_spec(), label) }}
+  {%- endif -%}
+{%- endmacro %}
@@ -0,0 +1,54 @@
+{{
+    config(
+        materialized='table'
+    )
+}}
+
+-- Member-level measures per employer and enrollment day.
+-- agg_member_enrollment_summary has one row per member, so each member lands in
+-- exactly one employer-day: member counts stay exact when summed across days.
+-- Only the quantiles need a sketch:
+--   kll_quantiles.merge_int64(<x>_sketch, 100)       -> all percentiles in one array
+-- Rebuilt in full every run: enrollment status and first-screening facts change
+-- retroactively for old enrollment days, so there is no safe incremental window.
+
+with member_summary as (
+    select * from {{ ref('agg_member_enrollment_summary') }}
+),
+
+final as (
+    select
+        -- Grain
+        employer_id,
+        enrollment_date,
+
+        -- Member counts (one row per member, so exact when summed)
+        count(*) as member_count,
+        countif(enrollment_status = 'Active') as active_members,
+        countif(enrollment_status = 'Completed') as completed_members,
+        countif(enrollment_status = 'Inactive') as inactive_members,
+        countif(has_completed_screening = 1) as screened_members,
+        countif(multiple_screenings_flag = 1) as repeat_screening_members,
+
+        -- Quantile sketch (KLL)
+        kll_quantiles.init_int64(days_to_first_screening) as days_to_first_screening_sketch,
+
+        -- Additive measures (merge with sum)
+        count(days_to_first_screening) as members_with_first_screening,
+        sum(days_to_first_screening) as sum_days_to_first_screening,
+        sum(total_screenings) as total_screenings,
+        sum(follow_ups_needed) as follow_ups_needed,
+        sum(follow_ups_completed) as follow_ups_completed,
+        sum(total_screening_cost) as total_screening_cost,
+        sum(cancer_detections) as cancer_detections,
+
+        -- Metadata
+        max(loaded_at) as loaded_at
+
+    from member_summary
+    group by
+        employer_id,
+        enrollment_date
+)
+
+select * from final
@@ -0,0 +1,118 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key=['employer_id', 'screening_date']
+    )
+}}
+
+-- Mergeable screening sketches per employer and screening day.
+-- hll_count.merge(members_screened_sketch) gives distinct members screened over
+-- any set of days without rescanning fct_screenings.
+
+{% if is_incremental() %}
+-- Days touched by newly loaded screenings (late arrivals merge into their original day)
+with loaded_dates as (
+    select distinct screening_date
+    from {{ ref('fct_screenings') }}
+    where loaded_at > (select max(loaded_at) from {{ this }})
+),
+
+-- Days whose stored count no longer matches fct_screenings: a re-delivered screening
+-- moved out to another day or employer, or was removed. An employer-day can only keep
+-- its count while changing membership by gaining a newly loaded row, which
+-- loaded_dates already covers. Counting only reads (employer_id, screening_date), and
+-- unlike a marker on fct_screenings it doesn't depend on run order.
+fct_counts as (
+    select employer_id, screening_date, count(*) as total_screenings
+    from {{ ref('fct_screenings') }}
+    group by employer_id, screening_date
+),
+
+stale_dates as (
+    select distinct screening_date
+    from {{ this }} t
+    full outer join fct_counts c using (employer_id, screening_date)
+    where coalesce(t.total_screenings, 0) != coalesce(c.total_screenings, 0)
+),
+
+-- Whole days are rebuilt, which also covers screenings that changed employer_id
+affected_dates as (
+    select screening_date from loaded_dates
+    union distinct
+    select screening_date from stale_dates
+),
+
+screenings as (
+    select * from {{ ref('fct_screenings') }}
+    where screening_date in (select screening_date from affected_dates)
+),
+{% else %}
+with screenings as (
+    select * from {{ ref('fct_screenings') }}
+),
+{% endif %}
+
+daily as (
+    select
+        -- Grain
+        employer_id,
+        screening_date,
+
+        -- Distinct member sketch (HLL++)
+        hll_count.init(member_id) as members_screened_sketch,
+
+        -- Additive measures (merge with sum)
+        count(*) as total_screenings,
+        sum(normal_flag) as normal_results,
+        sum(abnormal_flag) as abnormal_results,
+        sum(cancer_detected_flag) as cancer_detections,
+        countif(follow_up_needed) as follow_ups_needed,
+        sum(follow_up_completed_flag) as follow_ups_completed,
+        sum(follow_up_missing_flag) as follow_ups_missing,
+        count(days_to_result) as screenings_with_result,
+        sum(days_to_result) as sum_days_to_result,
+        sum(cost) as total_cost,
+
+        -- Metadata
+        max(loaded_at) as loaded_at
+
+    from screenings
+    group by
+        employer_id,
+        screening_date
+),
+
+final as (
+    select * from daily
+
+    {% if is_incremental() %}
+    -- Merge can't delete: employer-days left with no screenings are zeroed out
+    union all
+
+    select
+        t.employer_id,
+        t.screening_date,
+        cast(null as bytes) as members_screened_sketch,
+        0 as total_screenings,
+        0 as normal_results,
+        0 as abnormal_results,
+        0 as cancer_detections,
+        0 as follow_ups_needed,
+        0 as follow_ups_completed,
+        0 as follow_ups_missing,
+        0 as screenings_with_result,
+        0 as sum_days_to_result,
+        0 as total_cost,
+        t.loaded_at
+    from {{ this }} t
+    where t.screening_date in (select screening_date from affected_dates)
+      and not exists (
+          select 1
+          from daily d
+          where d.employer_id = t.employer_id
+            and d.screening_date = t.screening_date
+      )
+    {% endif %}
+)
+
+select * from final
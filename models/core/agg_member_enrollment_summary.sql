@@ -32,10 +32,10 @@ member_screening_summary as (
 final as (
     select
         -- Primary key (just use member_key - no need for separate journey_key)
-        {{ dbt_utils.generate_surrogate_key(['e.member_id']) }} as member_key,
+        e.member_key,
         
         -- Foreign key
-        {{ dbt_utils.generate_surrogate_key(['e.employer_id']) }} as employer_key,
+        e.employer_key,
         
         -- Natural keys
         e.member_id,
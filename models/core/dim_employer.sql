@@ -5,7 +5,7 @@ with employers as (
 final as (
     select
         -- Primary key
-        {{ dbt_utils.generate_surrogate_key(['employer_id']) }} as employer_key,
+        employer_key,
         
         -- Natural key
         employer_id,
@@ -5,7 +5,7 @@ with members as (
 final as (
     select
         -- Primary key
-        {{ dbt_utils.generate_surrogate_key(['member_id']) }} as member_key,
+        member_key,
         
         -- Natural key
         member_id,
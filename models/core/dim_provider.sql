@@ -5,7 +5,7 @@ with providers as (
 final as (
     select
         -- Primary key
-        {{ dbt_utils.generate_surrogate_key(['provider_id']) }} as provider_key,
+        provider_key,
         
         -- Natural key
         provider_id,
@@ -11,29 +11,32 @@ with screenings as (
     {% if is_incremental() %}
     -- Hybrid incremental strategy to handle late-arriving data:
     -- 1. Capture new records by loaded_at (primary mechanism)
-    -- 2. Recapture screenings from last 7 days to catch late arrivals
+    -- 2. Recapture screenings from the last N days to catch late arrivals
     --    (e.g., a screening dated Jan 5 arriving after Jan 10 screening)
-    -- This ensures we don't miss records while avoiding full table scans
-    where loaded_at > (select max(loaded_at) from {{ this }})
-       or screening_date >= date_sub(
+    -- This ensures we don't miss records while avoiding full table scans.
+    -- Both are vars so replay_screenings.py can tune them against real runs.
+    where screening_date >= date_sub(
             (select max(screening_date) from {{ this }}),
-            interval 7 day
+            interval {{ var('screenings_lookback_days', 7) }} day
           )
+    {% if var('screenings_use_loaded_at', true) %}
+       or loaded_at > (select max(loaded_at) from {{ this }})
+    {% endif %}
 {% endif %}
 ),
 
 final as (
     select
         -- Primary key
-        {{ dbt_utils.generate_surrogate_key(['screening_id']) }} as screening_key,
+        screening_key,
         
         -- Natural key
         screening_id,
         
-        -- Foreign keys (surrogate keys generated from natural keys)
-        {{ dbt_utils.generate_surrogate_key(['member_id']) }} as member_key,
-        {{ dbt_utils.generate_surrogate_key(['employer_id']) }} as employer_key,
-        {{ dbt_utils.generate_surrogate_key(['provider_id']) }} as provider_key,
+        -- Foreign keys (surrogate keys computed in stg_screenings)
+        member_key,
+        employer_key,
+        provider_key,
         
         -- Degenerate dimensions (natural keys for reference)
         member_id,
@@ -8,51 +8,17 @@ with employers as (
     select * from {{ ref('dim_employer') }}
 ),
 
-screenings as (
-    select * from {{ ref('fct_screenings') }}
-),
-
-screening_outcomes as (
-    select
-        s.employer_id,
-        s.screening_type,
-        s.result,
-        
-        -- Screening counts
-        count(*) as total_screenings,
-        count(distinct s.member_id) as unique_members_screened,
-        
-        -- Result metrics
-        count(case when s.normal_flag = 1 then 1 end) as normal_results,
-        count(case when s.abnormal_flag = 1 then 1 end) as abnormal_results,
-        count(case when s.cancer_detected_flag = 1 then 1 end) as cancer_detections,
-        
-        -- Follow-up metrics
-        count(case when s.follow_up_needed then 1 end) as follow_ups_needed,
-        count(case when s.follow_up_completed_flag = 1 then 1 end) as follow_ups_completed,
-        count(case when s.follow_up_missing_flag = 1 then 1 end) as follow_ups_missing,
-        
-        -- Time metrics
-        avg(s.days_to_result) as avg_days_to_result,
-        
-        -- Cost metrics
-        sum(s.cost) as total_cost,
-        avg(s.cost) as avg_cost_per_screening
-        
-    from screenings s
-    group by 
-        s.employer_id,
-        s.screening_type,
-        s.result
+screening_sketches as (
+    select * from {{ ref('agg_employer_daily_screening_sketches') }}
 ),
 
 employer_summary as (
     select
         employer_id,
         
-        -- Overall metrics
+        -- Overall metrics (HLL sketches merged across screening days)
         sum(total_screenings) as total_screenings,
-        count(distinct unique_members_screened) as unique_members_screened,
+        hll_count.merge(members_screened_sketch) as unique_members_screened,
         sum(normal_results) as normal_results,
         sum(abnormal_results) as abnormal_results,
         sum(cancer_detections) as cancer_detections,
@@ -63,11 +29,11 @@ employer_summary as (
         sum(follow_ups_missing) as follow_ups_missing,
         
         -- Time and cost
-        avg(avg_days_to_result) as avg_days_to_result,
+        safe_divide(sum(sum_days_to_result), sum(screenings_with_result)) as avg_days_to_result,
         sum(total_cost) as total_program_cost,
-        avg(avg_cost_per_screening) as avg_cost_per_screening
+        safe_divide(sum(total_cost), sum(total_screenings)) as avg_cost_per_screening
         
-    from screening_outcomes
+    from screening_sketches
     group by employer_id
 ),
 
@@ -8,49 +8,44 @@ with employers as (
     select * from {{ ref('dim_employer') }}
 ),
 
-members as (
-    select * from {{ ref('dim_member') }}
-),
-
-member_summary as (
-    select * from {{ ref('agg_member_enrollment_summary') }}
+member_sketches as (
+    select * from {{ ref('agg_employer_daily_member_sketches') }}
 ),
 
 employer_metrics as (
     select
-        m.employer_id,
+        employer_id,
         
-        -- Enrollment metrics
-        count(distinct m.member_id) as total_enrolled_members,
-        count(distinct case when m.enrollment_status = 'Active' then m.member_id end) as active_members,
-        count(distinct case when m.enrollment_status = 'Completed' then m.member_id end) as completed_members,
-        count(distinct case when m.enrollment_status = 'Inactive' then m.member_id end) as inactive_members,
+        -- Enrollment metrics (exact: each member is counted on one enrollment day)
+        sum(member_count) as total_enrolled_members,
+        sum(active_members) as active_members,
+        sum(completed_members) as completed_members,
+        sum(inactive_members) as inactive_members,
         
         -- Participation metrics
-        count(distinct case when m.has_completed_screening = 1 then m.member_id end) as members_completed_screening,
-        sum(m.total_screenings) as total_screenings,
+        sum(screened_members) as members_completed_screening,
+        sum(total_screenings) as total_screenings,
         
-        -- Time-to-screening metrics
-        avg(m.days_to_first_screening) as avg_days_to_first_screening,
-        approx_quantiles(m.days_to_first_screening, 100)[offset(50)] as median_days_to_first_screening,
-        approx_quantiles(m.days_to_first_screening, 100)[offset(90)] as p90_days_to_first_screening,
+        -- Time-to-screening metrics (one KLL merge yields every percentile)
+        safe_divide(sum(sum_days_to_first_screening), sum(members_with_first_screening)) as avg_days_to_first_screening,
+        kll_quantiles.merge_int64(days_to_first_screening_sketch, 100) as days_to_first_screening_quantiles,
         
         -- Follow-up metrics
-        sum(m.follow_ups_needed) as total_follow_ups_needed,
-        sum(m.follow_ups_completed) as total_follow_ups_completed,
+        sum(follow_ups_needed) as total_follow_ups_needed,
+        sum(follow_ups_completed) as total_follow_ups_completed,
         
         -- Cost metrics
-        sum(m.total_screening_cost) as total_program_cost,
-        avg(m.total_screening_cost) as avg_cost_per_member,
+        sum(total_screening_cost) as total_program_cost,
+        safe_divide(sum(total_screening_cost), sum(member_count)) as avg_cost_per_member,
         
         -- Engagement metrics
-        count(distinct case when m.multiple_screenings_flag = 1 then m.member_id end) as members_with_multiple_screenings,
+        sum(repeat_screening_members) as members_with_multiple_screenings,
         
         -- Cancer detection
-        sum(m.cancer_detections) as total_cancer_detections
+        sum(cancer_detections) as total_cancer_detections
         
-    from member_summary m
-    group by m.employer_id
+    from member_sketches
+    group by employer_id
 ),
 
 final as (
@@ -80,8 +75,8 @@ final as (
         
         -- Time-to-screening metrics
         round(em.avg_days_to_first_screening, 1) as avg_days_to_first_screening,
-        round(em.median_days_to_first_screening, 1) as median_days_to_first_screening,
-        round(em.p90_days_to_first_screening, 1) as p90_days_to_first_screening,
+        round(em.days_to_first_screening_quantiles[safe_offset(50)], 1) as median_days_to_first_screening,
+        round(em.days_to_first_screening_quantiles[safe_offset(90)], 1) as p90_days_to_first_screening,
         
         -- Follow-up metrics
         coalesce(em.total_follow_ups_needed, 0) as total_follow_ups_needed,
@@ -18,6 +18,7 @@ final as (
         -- IDs
         b.screening_id,
         b.member_id,
+        b.employer_id,
         
         -- Actual outcome
         b.outcome as actual_completed,
@@ -31,12 +32,8 @@ final as (
         -- Risk score (0-100 scale for business users)
         round((1 - p.predicted_completion_probability) * 100, 0) as non_completion_risk_score,
         
-        -- Risk tier (for operational prioritization)
-        case
-            when p.predicted_completion_probability < 0.40 then 'Tier 1 - Critical Outreach'
-            when p.predicted_completion_probability < 0.70 then 'Tier 2 - Standard Outreach'
-            else 'Tier 3 - Monitor Only'
-        end as outreach_priority,
+        -- Risk tier (for operational prioritization; thresholds from var('risk_tiers'))
+        {{ risk_tier_case('p.predicted_completion_probability', 'outreach_priority', 'b.employer_id') }} as outreach_priority,
         
         -- Feature context (for explaining predictions)
         b.age_group,
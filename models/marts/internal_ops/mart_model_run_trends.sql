@@ -0,0 +1,124 @@
+{{
+    config(
+        materialized='table'
+    )
+}}
+
+with model_runs as (
+    select
+        * replace (coalesce(full_refresh, false) as full_refresh)  -- null for rows logged before the flag was recorded
+    from {{ source('meta', 'meta_model_runs') }}
+    where resource_type = 'model'
+      and status = 'success'
+),
+
+-- Model may be executed more than once per invocation (e.g., retries)
+latest_per_invocation as (
+    select *
+    from model_runs
+    qualify row_number() over (
+        partition by invocation_id, node_unique_id
+        order by logged_at desc
+    ) = 1
+),
+
+run_totals as (
+    select
+        invocation_id,
+        sum(execution_time_seconds) as run_execution_time_seconds,
+        sum(bytes_processed) as run_bytes_processed
+    from latest_per_invocation
+    group by invocation_id
+),
+
+with_history as (
+    select
+        m.*,
+        t.run_execution_time_seconds,
+        t.run_bytes_processed,
+
+        -- Baseline: previous 7 successful runs of the same model in the same mode, so a
+        -- scheduled --full-refresh of an incremental model isn't compared with incremental runs
+        avg(m.execution_time_seconds) over (
+            partition by m.node_unique_id, m.full_refresh
+            order by m.run_started_at
+            rows between 7 preceding and 1 preceding
+        ) as trailing_avg_execution_time_seconds,
+        avg(m.bytes_processed) over (
+            partition by m.node_unique_id, m.full_refresh
+            order by m.run_started_at
+            rows between 7 preceding and 1 preceding
+        ) as trailing_avg_bytes_processed,
+        count(*) over (
+            partition by m.node_unique_id, m.full_refresh
+            order by m.run_started_at
+            rows between 7 preceding and 1 preceding
+        ) as baseline_run_count,
+
+        rank() over (
+            partition by m.invocation_id
+            order by m.execution_time_seconds desc
+        ) as execution_time_rank_in_run,
+        rank() over (
+            partition by m.invocation_id
+            order by m.bytes_processed desc
+        ) as bytes_processed_rank_in_run,
+
+        m.run_started_at = max(m.run_started_at) over () as is_latest_run
+    from latest_per_invocation m
+    inner join run_totals t
+        on m.invocation_id = t.invocation_id
+)
+
+select
+    invocation_id,
+    run_started_at,
+    date(run_started_at) as run_date,
+    target_name,
+    command,
+    selector,
+    full_refresh,
+    node_name as model_name,
+    materialization,
+
+    -- Run cost
+    round(execution_time_seconds, 2) as execution_time_seconds,
+    rows_affected,
+    bytes_processed,
+    bytes_billed,
+    slot_ms,
+    round(safe_divide(bytes_processed, pow(1024, 3)), 3) as gb_processed,
+
+    -- Share of the whole run
+    round(safe_divide(execution_time_seconds, run_execution_time_seconds) * 100, 1) as pct_of_run_time,
+    round(safe_divide(bytes_processed, run_bytes_processed) * 100, 1) as pct_of_run_bytes,
+    execution_time_rank_in_run,
+    bytes_processed_rank_in_run,
+
+    -- Trend vs. trailing baseline
+    baseline_run_count,
+    round(trailing_avg_execution_time_seconds, 2) as trailing_avg_execution_time_seconds,
+    round(
+        safe_divide(execution_time_seconds - trailing_avg_execution_time_seconds, trailing_avg_execution_time_seconds) * 100,
+        1
+    ) as execution_time_change_pct,
+    round(trailing_avg_bytes_processed, 0) as trailing_avg_bytes_processed,
+    round(
+        safe_divide(bytes_processed - trailing_avg_bytes_processed, trailing_avg_bytes_processed) * 100,
+        1
+    ) as bytes_processed_change_pct,
+
+    -- Regression: 50%+ slower or 50%+ more bytes than baseline, ignoring sub-second noise
+    case
+        when baseline_run_count < 3 then false
+        when execution_time_seconds >= 1
+             and execution_time_seconds > 1.5 * trailing_avg_execution_time_seconds then true
+        when bytes_processed > 1.5 * trailing_avg_bytes_processed then true
+        else false
+    end as is_regression,
+
+    is_latest_run,
+    current_timestamp() as calculated_at
+
+from with_history
+order by run_started_at desc, execution_time_seconds desc
@@ -21,6 +21,7 @@ feature_prep as (
         s.screening_key,
         s.member_id,
         s.member_key,
+        s.employer_id,
         
         -- Outcome variable (dependent variable for logistic regression)
         CASE WHEN s.follow_up_completed_flag = 1 THEN TRUE ELSE FALSE END as outcome,
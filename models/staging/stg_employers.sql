@@ -6,6 +6,7 @@ cleaned as (
     select
         -- Primary key
         employer_id,
+        {{ generate_surrogate_key(['employer_id']) }} as employer_key,
         
         -- Employer attributes
         employer_name,
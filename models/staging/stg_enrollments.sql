@@ -10,6 +10,8 @@ cleaned as (
         -- Foreign keys
         member_id,
         employer_id,
+        {{ generate_surrogate_key(['member_id']) }} as member_key,
+        {{ generate_surrogate_key(['employer_id']) }} as employer_key,
         
         -- Enrollment attributes
         enrollment_date,
@@ -6,9 +6,11 @@ cleaned as (
     select
         -- Primary key
         member_id,
+        {{ generate_surrogate_key(['member_id']) }} as member_key,
         
         -- Foreign keys
         employer_id,
+        {{ generate_surrogate_key(['employer_id']) }} as employer_key,
         
         -- Member attributes
         first_name,
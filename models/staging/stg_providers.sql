@@ -6,6 +6,7 @@ cleaned as (
     select
         -- Primary key
         provider_id,
+        {{ generate_surrogate_key(['provider_id']) }} as provider_key,
         
         -- Provider attributes
         provider_name,
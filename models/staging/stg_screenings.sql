@@ -1,3 +1,11 @@
+{#- raw_screenings may carry a delivery timestamp (e.g. replayed batches); otherwise
+    rows are stamped with the load time -#}
+{%- set source_columns = [] -%}
+{%- if execute -%}
+    {%- set source_columns = adapter.get_columns_in_relation(source('raw', 'raw_screenings'))
+        | map(attribute='name') | map('lower') | list -%}
+{%- endif %}
+
 with source as (
     select * from {{ source('raw', 'raw_screenings') }}
 ),
@@ -6,11 +14,15 @@ cleaned as (
     select
         -- Primary key
         screening_id,
+        {{ generate_surrogate_key(['screening_id']) }} as screening_key,
         
         -- Foreign keys
         member_id,
         employer_id,
         provider_id,
+        {{ generate_surrogate_key(['member_id']) }} as member_key,
+        {{ generate_surrogate_key(['employer_id']) }} as employer_key,
+        {{ generate_surrogate_key(['provider_id']) }} as provider_key,
         
         -- Screening attributes
         screening_type,
@@ -29,7 +41,11 @@ cleaned as (
         DATE_DIFF(result_date, screening_date, DAY) as days_to_result,
         
         -- Metadata
+        {% if 'loaded_at' in source_columns -%}
+        coalesce(cast(loaded_at as timestamp), CURRENT_TIMESTAMP()) as loaded_at
+        {%- else -%}
         CURRENT_TIMESTAMP() as loaded_at
+        {%- endif %}
         
     from source
 )
@@ -0,0 +1,30 @@
+# =============================================================================
+# SHARED PIPELINE CONFIG
+# =============================================================================
+# Every pipeline script keeps its own DEFAULT_CONFIG and reads one section of
+# the shared YAML config file (see config/pipeline.yml) through load_config.
+
+
+def load_config(path=None, section=None, defaults=None, **overrides):
+    """
+    Build a run configuration from defaults, an optional YAML config file and overrides.
+
+    The config file is shared by all pipeline stages; only the given section is
+    read. Overrides set to None are ignored so unset CLI flags fall through.
+    Raises ValueError on keys missing from defaults.
+    """
+    config = dict(defaults or {})
+
+    if path:
+        import yaml  # Installed alongside dbt; only needed when a config file is used
+
+        with open(path) as f:
+            config.update((yaml.safe_load(f) or {}).get(section) or {})
+
+    config.update({key: value for key, value in overrides.items() if value is not None})
+
+    unknown = sorted(set(config) - set(defaults or {}))
+    if unknown:
+        raise ValueError(f"Unknown '{section}' config keys: {', '.join(unknown)}")
+
+    return config
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Pipeline scripts live at the project root and in analyses/, not in a package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'analyses')]
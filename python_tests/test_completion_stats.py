@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from logistic_regression_analysis import (
+    DAYS_TO_RESULT_LABELS, EDA_SEGMENTS, compute_completion_stats,
+)
+
+
+@pytest.fixture(scope='module')
+def followups():
+    rng = np.random.default_rng(0)
+    n = 5_000
+    df = pd.DataFrame({
+        'age_group': rng.choice(['Under 40', '40-49', '50-64', '65+', None], n),
+        'gender': rng.choice(['Female', 'Male', 'Other'], n),
+        'screening_type': rng.choice(['Mammogram', 'Colonoscopy', None], n),
+        'day_of_week_result_delivered': rng.choice(['Monday', 'Friday', 'Sunday'], n),
+        'days_to_result': rng.choice([1, 6, 7, 8, 13, 14, 15, 20, 21, 22, 40, np.nan], n),
+        'outcome_binary': rng.integers(0, 2, n),
+    })
+    return df
+
+
+def days_to_result_bin(days):
+    """The CASE in analysis_followup_descriptive, row by row (NULL falls to ELSE)."""
+    if days <= 7:
+        return '≤7 days'
+    if days <= 14:
+        return '8-14 days'
+    if days <= 21:
+        return '15-21 days'
+    return '>21 days'
+
+
+def expected_stats(df):
+    frame = df.assign(days_bin=df['days_to_result'].map(days_to_result_bin))
+    segments = EDA_SEGMENTS + [('Days to Result', 'days_bin')]
+    expected = {}
+    for segment_type, column in segments:
+        grouped = frame.groupby(column, dropna=False)['outcome_binary'].agg(['count', 'sum'])
+        for value, row in grouped.iterrows():
+            value = None if pd.isna(value) else value
+            expected[(segment_type, value)] = (row['count'], row['sum'])
+    return expected
+
+
+def test_matches_per_column_groupby(followups):
+    stats = compute_completion_stats(followups)
+    actual = {
+        (row.segment_type, None if pd.isna(row.segment_value) else row.segment_value):
+            (row.total_records, row.completed)
+        for row in stats[stats['segment_type'] != 'Overall'].itertuples()
+    }
+    assert actual == expected_stats(followups)
+
+
+def test_null_segments_keep_totals(followups):
+    stats = compute_completion_stats(followups)
+    totals = stats.groupby('segment_type')['total_records'].sum()
+    assert (totals == len(followups)).all()
+    assert stats[(stats['segment_type'] == 'Age Group') & stats['segment_value'].isna()]['total_records'].item() \
+        == followups['age_group'].isna().sum()
+
+
+def test_days_to_result_bin_edges():
+    days = [7, 8, 14, 15, 21, 22, np.nan]
+    df = pd.DataFrame({
+        'age_group': 'Under 40', 'gender': 'Female', 'screening_type': 'Mammogram',
+        'day_of_week_result_delivered': 'Monday', 'days_to_result': days, 'outcome_binary': 1,
+    })
+    stats = compute_completion_stats(df)
+    bins = stats[stats['segment_type'] == 'Days to Result'].set_index('segment_value')['total_records']
+    assert bins.to_dict() == dict(zip(DAYS_TO_RESULT_LABELS, [1, 2, 2, 2]))
@@ -0,0 +1,36 @@
+import pytest
+
+from expand_screenings_data import main
+from generate_synthetic_data import generate_synthetic_data, write_tables
+
+
+@pytest.fixture(scope='module')
+def seeds_dir(tmp_path_factory):
+    seeds_dir = tmp_path_factory.mktemp('seeds')
+    write_tables(generate_synthetic_data({'num_members': 50}), str(seeds_dir))
+    return seeds_dir
+
+
+def expand_args(seeds_dir, tmp_path, **paths):
+    paths = {
+        'input_path': seeds_dir / 'raw_screenings.csv',
+        'members_path': seeds_dir / 'raw_members.csv',
+        'enrollments_path': seeds_dir / 'raw_enrollments.csv',
+        'providers_path': seeds_dir / 'raw_providers.csv',
+        **paths,
+    }
+    args = ['--new-screenings', '10', '--output-path', str(tmp_path / 'out.csv'), '--backup-path', '']
+    for key, path in paths.items():
+        args += ['--' + key.replace('_', '-'), str(path)]
+    return args
+
+
+def test_expands_screenings(seeds_dir, tmp_path):
+    assert main(expand_args(seeds_dir, tmp_path)) == 0
+    assert (tmp_path / 'out.csv').exists()
+
+
+@pytest.mark.parametrize('missing', ['input_path', 'members_path', 'enrollments_path', 'providers_path'])
+def test_missing_seed_reports_error(seeds_dir, tmp_path, capsys, missing):
+    assert main(expand_args(seeds_dir, tmp_path, **{missing: tmp_path / 'missing.csv'})) == 1
+    assert 'missing.csv not found' in capsys.readouterr().out
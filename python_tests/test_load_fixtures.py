@@ -0,0 +1,91 @@
+import csv
+import os
+import re
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from generate_synthetic_data import DATE_COLUMNS, generate_synthetic_data, write_tables
+from load_fixtures import COLUMN_TYPES, load_column_types, load_fixtures, read_parquet_fixture
+
+SEEDS_YML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'seeds', 'seeds.yml')
+
+
+@pytest.fixture(scope='module')
+def parquet_dir(tmp_path_factory):
+    """Small generator run written as Parquet, like a benchmark fixture."""
+    output_dir = tmp_path_factory.mktemp('fixtures')
+    write_tables(generate_synthetic_data({'num_members': 50}), str(output_dir), 'parquet')
+    return output_dir
+
+
+def test_generator_writes_csv_dates_for_dbt_seed(tmp_path):
+    # seeds.yml declares these columns as DATE; timestamps would fail `dbt seed`
+    paths = write_tables(generate_synthetic_data({'num_members': 50}), str(tmp_path), 'csv')
+    checked = 0
+    for path in paths:
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                for column in DATE_COLUMNS:
+                    if row.get(column):
+                        assert re.fullmatch(r'\d{4}-\d{2}-\d{2}', row[column]), (path, column, row[column])
+                        checked += 1
+    assert checked
+
+
+def test_generator_writes_date_columns_as_date32(parquet_dir):
+    schema = pq.read_schema(parquet_dir / 'raw_screenings.parquet')
+    assert schema.field('screening_date').type == pa.date32()
+    assert schema.field('result_date').type == pa.date32()
+
+
+def test_parquet_fixtures_cast_to_declared_schema(parquet_dir):
+    for table, column_types in load_column_types(SEEDS_YML).items():
+        path = parquet_dir / f'{table}.parquet'
+        if not path.exists():
+            continue
+        loaded = read_parquet_fixture(str(path), column_types)
+        assert loaded.schema == pa.schema([
+            (column, pa.type_for_alias(COLUMN_TYPES[type_][3])) for column, type_ in column_types.items()
+        ])
+
+
+def test_timestamp_parquet_still_loads_into_date_columns(parquet_dir, tmp_path):
+    # Parquet written straight from datetime64 frames stores TIMESTAMPs
+    table = pq.read_table(parquet_dir / 'raw_members.parquet')
+    table = table.set_column(
+        table.schema.get_field_index('date_of_birth'), 'date_of_birth',
+        table['date_of_birth'].cast(pa.timestamp('us')),
+    )
+    pq.write_table(table, tmp_path / 'raw_members.parquet')
+
+    column_types = load_column_types(SEEDS_YML)['raw_members']
+    loaded = read_parquet_fixture(str(tmp_path / 'raw_members.parquet'), column_types)
+    assert loaded.schema.field('date_of_birth').type == pa.date32()
+
+
+def test_duckdb_round_trip_matches_declared_types(parquet_dir, tmp_path):
+    duckdb = pytest.importorskip('duckdb')
+    duckdb_path = str(tmp_path / 'fixtures.duckdb')
+
+    results = load_fixtures({
+        'fixture_dir': str(parquet_dir),
+        'seeds_yml': SEEDS_YML,
+        'engine': 'duckdb',
+        'duckdb_path': duckdb_path,
+    })
+    assert len(results) and (results['rows'] > 0).all()
+
+    connection = duckdb.connect(duckdb_path)
+    try:
+        for table, column_types in load_column_types(SEEDS_YML).items():
+            if table not in set(results['table']):
+                continue
+            loaded = dict(connection.execute(
+                "select column_name, data_type from information_schema.columns where table_name = ?", [table]
+            ).fetchall())
+            assert loaded == {column: COLUMN_TYPES[type_][1] for column, type_ in column_types.items()}
+    finally:
+        connection.close()
@@ -0,0 +1,33 @@
+import pytest
+
+from generate_synthetic_data import generate_synthetic_data
+from replay_screenings import main, run_replay
+
+
+@pytest.fixture(scope='module')
+def screenings():
+    return generate_synthetic_data({'num_members': 300})['raw_screenings']
+
+
+def test_default_settings_match_full_refresh(screenings):
+    _, comparison = run_replay({'engine': 'local'}, screenings=screenings)
+    assert comparison == {'missing_rows': 0, 'extra_rows': 0, 'differing_rows': 0}
+
+
+def test_short_lookback_without_loaded_at_misses_late_rows(screenings):
+    _, comparison = run_replay(
+        {'engine': 'local', 'lookback_days': 1, 'use_loaded_at': False}, screenings=screenings
+    )
+    assert comparison['missing_rows'] > 0
+
+
+@pytest.mark.parametrize('target', [None, 'default'])
+def test_dbt_engine_requires_non_default_target(screenings, target):
+    with pytest.raises(ValueError, match='non-default --target'):
+        run_replay({'engine': 'dbt', 'target': target}, screenings=screenings)
+
+
+def test_main_reports_missing_target(tmp_path, screenings):
+    input_path = tmp_path / 'raw_screenings.csv'
+    screenings.to_csv(input_path, index=False)
+    assert main(['--engine', 'dbt', '--input-path', str(input_path)]) == 1
@@ -0,0 +1,127 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logistic_regression_analysis import (
+    assign_risk_tiers, load_risk_tiers, risk_tier_spec, tier_records,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DBT_PROJECT = os.path.join(ROOT, 'dbt_project.yml')
+RISK_TIER_MACROS = os.path.join(ROOT, 'macros', 'risk_tier_case.sql')
+
+LABELS = ('risk_category', 'outreach_priority')
+CLIENT_OVERRIDE = {'EMP001': {'thresholds': [0.50, 0.80]}}
+
+
+@pytest.fixture(scope='module')
+def tiers():
+    return load_risk_tiers(DBT_PROJECT)
+
+
+@pytest.fixture(scope='module')
+def tiers_with_client(tiers):
+    return {**tiers, 'clients': CLIENT_OVERRIDE}
+
+
+def edge_probabilities(thresholds, n=2_000_000, seed=0):
+    """Random and grid probabilities plus every threshold, its neighbouring floats, 0, 1 and NaN."""
+    rng = np.random.default_rng(seed)
+    edges = [0.0, 1.0, np.nan]
+    for threshold in thresholds:
+        edges += [
+            np.nextafter(threshold, -np.inf), threshold, np.nextafter(threshold, np.inf),
+        ]
+    return np.concatenate([
+        rng.random(n),
+        np.linspace(0.0, 1.0, 100_001),
+        np.round(rng.random(n // 4), 2),  # Two-decimal probabilities land on thresholds
+        np.asarray(edges),
+    ])
+
+
+def case_tiers(probabilities, thresholds, labels):
+    """The risk_tier_case CASE, branch by branch: first `p < threshold` wins, null stays null."""
+    probabilities = np.asarray(probabilities, dtype=float)
+    conditions = [np.isnan(probabilities)] + [probabilities < threshold for threshold in thresholds]
+    return np.select(conditions, [None] + list(labels[:-1]), default=labels[-1])
+
+
+def render_case(spec, label):
+    """Render risk_tier_case_for_spec from the dbt macro file for a given spec."""
+    jinja2 = pytest.importorskip('jinja2')
+    with open(RISK_TIER_MACROS) as f:
+        source = f.read()
+    env = jinja2.Environment(extensions=['jinja2.ext.do'])
+    return str(env.from_string(source).module.risk_tier_case_for_spec('p', spec, label))
+
+
+@pytest.mark.parametrize('label', LABELS)
+def test_searchsorted_matches_case_semantics(tiers, label):
+    spec = risk_tier_spec(tiers)
+    probabilities = edge_probabilities(spec['thresholds'])
+
+    actual = assign_risk_tiers(probabilities, spec['thresholds'], spec[label])
+    expected = case_tiers(probabilities, spec['thresholds'], spec[label])
+
+    mismatches = np.flatnonzero(actual != expected)
+    assert mismatches.size == 0, probabilities[mismatches[:10]]
+
+
+@pytest.mark.parametrize('label', LABELS)
+def test_searchsorted_matches_rendered_sql_case(tiers_with_client, label):
+    duckdb = pytest.importorskip('duckdb')
+    for employer_id in (None, 'EMP001'):
+        spec = risk_tier_spec(tiers_with_client, employer_id)
+        probabilities = pd.DataFrame({'p': edge_probabilities(spec['thresholds'], n=500_000)})
+
+        expected = duckdb.sql(
+            f"select {render_case(spec, label)} as tier from probabilities"
+        ).df()['tier'].to_numpy(dtype=object)
+        expected[pd.isna(expected)] = None
+        actual = assign_risk_tiers(probabilities['p'], spec['thresholds'], spec[label])
+
+        mismatches = np.flatnonzero(actual != expected)
+        assert mismatches.size == 0, (employer_id, probabilities['p'].to_numpy()[mismatches[:10]])
+
+
+def test_tier_records_applies_client_overrides(tiers_with_client):
+    default = risk_tier_spec(tiers_with_client)
+    client = risk_tier_spec(tiers_with_client, 'EMP001')
+    probabilities = edge_probabilities(default['thresholds'] + client['thresholds'], n=1_000_000)
+    employer_ids = np.where(np.arange(probabilities.size) % 3 == 0, 'EMP001', 'EMP002')
+    df = pd.DataFrame({'employer_id': employer_ids, 'predicted_completion_probability': probabilities})
+
+    for label in LABELS:
+        actual = np.asarray(tier_records(df, tiers_with_client, label=label), dtype=object)
+        expected = np.where(
+            employer_ids == 'EMP001',
+            case_tiers(probabilities, client['thresholds'], client[label]),
+            case_tiers(probabilities, default['thresholds'], default[label]),
+        )
+        actual[pd.isna(actual)] = None
+
+        mismatches = np.flatnonzero(actual != expected)
+        assert mismatches.size == 0, probabilities[mismatches[:10]]
+
+
+def test_tier_records_orders_categories_by_risk(tiers):
+    df = pd.DataFrame({'predicted_completion_probability': [0.9, 0.1, 0.5]})
+    tiered = tier_records(df, tiers)
+    assert list(tiered.categories) == list(tiers['default']['risk_category'])
+    assert list(tiered) == [
+        tiers['default']['risk_category'][2],
+        tiers['default']['risk_category'][0],
+        tiers['default']['risk_category'][1],
+    ]
+
+
+@pytest.mark.parametrize('override, message', [
+    ({'thresholds': [0.70, 0.40]}, 'strictly increasing'),
+    ({'thresholds': [0.50]}, 'one label per tier'),
+])
+def test_risk_tier_spec_rejects_invalid_overrides(tiers, override, message):
+    with pytest.raises(ValueError, match=message):
+        risk_tier_spec({**tiers, 'clients': {'EMP001': override}}, 'EMP001')
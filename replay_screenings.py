@@ -0,0 +1,376 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from pipeline_config import load_config as _load_config
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+# Defaults for a replay run; override from the 'replay' section of a YAML
+# config file (see config/pipeline.yml), keyword arguments or CLI flags.
+CONFIG_SECTION = 'replay'
+
+DEFAULT_CONFIG = {
+    'seed': 42,
+    'input_path': 'seeds/raw_screenings.csv',
+    # Micro-batch cadence (pandas offset alias) and delivery disorder
+    'batch_frequency': '1D',
+    'late_rate': 0.05,             # Share of screenings arriving days to weeks late
+    'max_lateness_days': 30,
+    'out_of_order_rate': 0.10,     # Share of screenings slipping behind later-dated ones
+    'max_reorder_days': 3,
+    # Incremental logic being evaluated (mirrors fct_screenings)
+    'lookback_days': 7,
+    'use_loaded_at': True,         # False: rely on the screening_date lookback alone
+    'engine': 'local',             # local | dbt
+    'output_dir': None,            # Optionally write each batch as a CSV
+    # dbt engine only
+    'project_dir': '.',
+    'target': None,                # Required, and must not be 'default' (shared raw schema)
+    'seed_path': 'seeds/raw_screenings.csv',
+}
+
+ENGINES = ('local', 'dbt')
+
+# Columns compared between the incremental result and a full refresh
+COMPARE_COLUMNS = [
+    'member_id', 'employer_id', 'provider_id', 'screening_type', 'screening_date',
+    'result', 'result_date', 'follow_up_needed', 'follow_up_completed', 'cost'
+]
+
+# Order-independent fingerprint of fct_screenings, used by the dbt engine
+FINGERPRINT_SQL = """
+select
+    count(*) as row_count,
+    bit_xor(farm_fingerprint(concat(
+        screening_id, '|', member_id, '|', provider_id, '|', result, '|',
+        cast(screening_date as string), '|', cast(result_date as string), '|', cast(cost as string)
+    ))) as checksum
+from {{ ref('fct_screenings') }}
+"""
+
+
+def load_config(path=None, **overrides):
+    """Build a replay config from defaults, the 'replay' config section and overrides."""
+    return _load_config(path, section=CONFIG_SECTION, defaults=DEFAULT_CONFIG, **overrides)
+
+
+# =============================================================================
+# 1. BATCH GENERATION
+# =============================================================================
+
+def generate_replay_batches(screenings, config=None):
+    """
+    Split screenings into time-ordered micro-batches with late and out-of-order rows.
+
+    Each screening normally arrives the day after its screening_date. A
+    late_rate share is delayed by 1..max_lateness_days and an out_of_order_rate
+    share by 1..max_reorder_days, so they land in a batch after screenings
+    dated later than themselves. Rows are bucketed into batch_frequency windows
+    and stamped with the batch time as loaded_at.
+
+    Returns a list of (batch_loaded_at, DataFrame) sorted by time.
+    """
+    config = load_config(**(config or {}))
+    np.random.seed(config['seed'])
+
+    screenings = screenings.copy()
+    screening_date = pd.to_datetime(screenings['screening_date'])
+    num_rows = len(screenings)
+
+    delay_days = np.zeros(num_rows, dtype=np.int64)
+    disorder = np.random.random(num_rows)
+    late = disorder < config['late_rate']
+    reordered = ~late & (disorder < config['late_rate'] + config['out_of_order_rate'])
+    delay_days[late] = np.random.randint(1, config['max_lateness_days'] + 1, late.sum())
+    delay_days[reordered] = np.random.randint(1, config['max_reorder_days'] + 1, reordered.sum())
+
+    arrival = (
+        screening_date
+        + pd.to_timedelta(1 + delay_days, unit='D')
+        + pd.to_timedelta(np.random.randint(0, 24 * 60, num_rows), unit='min')
+    )
+    screenings['loaded_at'] = arrival.dt.ceil(config['batch_frequency'])
+
+    batches = [
+        (loaded_at, batch.sort_values('loaded_at', kind='stable').reset_index(drop=True))
+        for loaded_at, batch in screenings.groupby('loaded_at', sort=True)
+    ]
+
+    print(f"✅ Built {len(batches)} batches from {num_rows:,} screenings "
+          f"({late.sum():,} late, {reordered.sum():,} out of order)")
+
+    return batches
+
+
+def write_batches(batches, output_dir):
+    """Write each batch to <output_dir>/batch_<n>.csv and return the paths."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+    for batch_num, (loaded_at, batch) in enumerate(batches, start=1):
+        path = os.path.join(output_dir, f'batch_{str(batch_num).zfill(5)}.csv')
+        batch.to_csv(path, index=False)
+        paths.append(path)
+
+    return paths
+
+
+# =============================================================================
+# 2. LOCAL INCREMENTAL SIMULATION
+# =============================================================================
+
+def select_incremental_rows(source, target, config):
+    """
+    Apply the fct_screenings incremental filter to the staged source rows.
+
+    Mirrors: loaded_at > max(loaded_at) or screening_date >= max(screening_date) - lookback.
+    """
+    if target.empty:
+        return source
+
+    lookback_start = target['screening_date'].max() - pd.Timedelta(days=config['lookback_days'])
+    selected = source['screening_date'] >= lookback_start
+    if config['use_loaded_at']:
+        selected |= source['loaded_at'] > target['loaded_at'].max()
+
+    return source[selected]
+
+
+def replay_local(batches, config):
+    """
+    Feed batches through an in-memory copy of the fct_screenings incremental merge.
+
+    Returns (batch_stats, target, full_refresh) where batch_stats has one row
+    per batch with rows delivered/scanned/merged and processing time.
+    """
+    source = pd.DataFrame()
+    target = pd.DataFrame()
+    stats = []
+
+    for batch_num, (loaded_at, batch) in enumerate(batches, start=1):
+        batch = batch.assign(screening_date=pd.to_datetime(batch['screening_date']))
+        source = pd.concat([source, batch], ignore_index=True)
+
+        started = time.perf_counter()
+        selected = select_incremental_rows(source, target, config)
+        # Merge on the unique key: incoming rows replace existing ones
+        target = pd.concat([target, selected], ignore_index=True).drop_duplicates('screening_id', keep='last')
+        elapsed = time.perf_counter() - started
+
+        stats.append({
+            'batch': batch_num,
+            'loaded_at': loaded_at,
+            'rows_delivered': len(batch),
+            'rows_scanned': len(selected),
+            'target_rows': len(target),
+            'seconds': elapsed,
+        })
+
+    full_refresh = source.drop_duplicates('screening_id', keep='last')
+    return pd.DataFrame(stats), target, full_refresh
+
+
+def compare_to_full_refresh(target, full_refresh):
+    """Return counts of rows missing from, extra in, or differing in the incremental result."""
+    incremental = target.set_index('screening_id')[COMPARE_COLUMNS]
+    expected = full_refresh.set_index('screening_id')[COMPARE_COLUMNS]
+
+    common = expected.index.intersection(incremental.index)
+    actual, wanted = incremental.loc[common], expected.loc[common]
+    differing = (actual.ne(wanted) & ~(actual.isna() & wanted.isna())).any(axis=1)
+
+    return {
+        'missing_rows': len(expected.index.difference(incremental.index)),
+        'extra_rows': len(incremental.index.difference(expected.index)),
+        'differing_rows': int(differing.sum()),
+    }
+
+
+# =============================================================================
+# 3. DBT REPLAY
+# =============================================================================
+
+def _invoke_dbt(runner, args, config):
+    """Run a dbt command through the programmatic runner and fail loudly on errors."""
+    args = args + ['--project-dir', config['project_dir']]
+    if config['target']:
+        args += ['--target', config['target']]
+
+    result = runner.invoke(args)
+    if not result.success:
+        raise RuntimeError(f"dbt {' '.join(args)} failed: {result.exception}")
+    return result
+
+
+def _fingerprint(runner, config):
+    result = _invoke_dbt(runner, ['show', '--inline', FINGERPRINT_SQL, '--quiet'], config)
+    row = result.result.results[0].agate_table.rows[0]
+    return {'row_count': row[0], 'checksum': row[1]}
+
+
+def replay_dbt(batches, config):
+    """
+    Feed batches through the real incremental fct_screenings model with dbt.
+
+    For each batch the cumulative rows (with their batch loaded_at) are written
+    to the raw_screenings seed, reseeded, and stg_screenings + fct_screenings are
+    run incrementally with lookback_days / use_loaded_at passed as dbt vars.
+    After the last batch the table is fingerprinted, rebuilt with --full-refresh
+    and fingerprinted again. The original seed file is restored afterwards and
+    raw_screenings / fct_screenings are rebuilt from it.
+
+    This overwrites raw_screenings and fct_screenings in the target, so an
+    explicit non-default target is required: the default target seeds into the
+    shared raw schema.
+    """
+    if not config['target'] or config['target'] == 'default':
+        raise ValueError("The dbt engine overwrites raw_screenings and fct_screenings: "
+                         "pass an explicit non-default --target")
+
+    from dbt.cli.main import dbtRunner  # dbt-core >= 1.5, only needed for this engine
+
+    runner = dbtRunner()
+    dbt_vars = json.dumps({
+        'screenings_lookback_days': config['lookback_days'],
+        'screenings_use_loaded_at': config['use_loaded_at'],
+    })
+    seed_path = os.path.join(config['project_dir'], config['seed_path'])
+    backup_path = seed_path + '.replay_backup'
+    shutil.copy(seed_path, backup_path)
+
+    stats = []
+    delivered = []
+    try:
+        for batch_num, (loaded_at, batch) in enumerate(batches, start=1):
+            # stg_screenings keeps the seed's loaded_at, so each batch is stamped
+            # with its delivery time rather than the time of the dbt run
+            delivered.append(batch)
+            pd.concat(delivered, ignore_index=True).to_csv(seed_path, index=False)
+
+            started = time.perf_counter()
+            _invoke_dbt(runner, ['seed', '--select', 'raw_screenings', '--full-refresh'], config)
+            seeded = time.perf_counter()
+            # The first batch rebuilds fct_screenings so earlier runs don't leak in
+            run_args = ['run', '--select', 'stg_screenings', 'fct_screenings', '--vars', dbt_vars]
+            _invoke_dbt(runner, run_args + (['--full-refresh'] if batch_num == 1 else []), config)
+            finished = time.perf_counter()
+
+            stats.append({
+                'batch': batch_num,
+                'loaded_at': loaded_at,
+                'rows_delivered': len(batch),
+                'seed_seconds': seeded - started,
+                'seconds': finished - seeded,
+            })
+            print(f"   Batch {batch_num}/{len(batches)}: {len(batch):,} rows in {finished - seeded:.1f}s")
+
+        incremental = _fingerprint(runner, config)
+        _invoke_dbt(runner, ['run', '--select', 'fct_screenings', '--full-refresh', '--vars', dbt_vars], config)
+        full_refresh = _fingerprint(runner, config)
+    finally:
+        shutil.move(backup_path, seed_path)
+        # Rebuild from the restored seed so the target doesn't keep replay batches
+        _invoke_dbt(runner, ['seed', '--select', 'raw_screenings', '--full-refresh'], config)
+        _invoke_dbt(runner, ['run', '--select', 'stg_screenings', 'fct_screenings', '--full-refresh'], config)
+
+    comparison = {
+        'incremental_rows': incremental['row_count'],
+        'full_refresh_rows': full_refresh['row_count'],
+        'checksums_match': incremental['checksum'] == full_refresh['checksum'],
+    }
+    return pd.DataFrame(stats), comparison
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+def run_replay(config=None, screenings=None):
+    """
+    Build replay batches and feed them through the configured engine.
+
+    Pass screenings to replay an in-memory frame instead of config['input_path'].
+    Returns (batch_stats, comparison).
+    """
+    config = load_config(**(config or {}))
+    if config['engine'] not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {config['engine']!r}")
+
+    if screenings is None:
+        screenings = pd.read_csv(config['input_path'])
+
+    batches = generate_replay_batches(screenings, config)
+    if config['output_dir']:
+        write_batches(batches, config['output_dir'])
+
+    print(f"\n🔁 Replaying {len(batches)} batches through fct_screenings ({config['engine']} engine)...")
+    if config['engine'] == 'dbt':
+        return replay_dbt(batches, config)
+
+    batch_stats, target, full_refresh = replay_local(batches, config)
+    return batch_stats, compare_to_full_refresh(target, full_refresh)
+
+
+def print_summary(batch_stats, comparison, config):
+    print("\n" + "="*60)
+    print("INCREMENTAL REPLAY COMPLETE!")
+    print("="*60)
+    print(f"\n⚙️  Lookback window: {config['lookback_days']} days "
+          f"({'with' if config['use_loaded_at'] else 'without'} loaded_at)")
+    print(f"\n⏱️  Per-batch processing time:")
+    print(f"  Batches:   {len(batch_stats):,}")
+    print(f"  Total:     {batch_stats['seconds'].sum():.2f}s")
+    print(f"  Mean:      {batch_stats['seconds'].mean() * 1000:.1f}ms")
+    print(f"  p95:       {batch_stats['seconds'].quantile(0.95) * 1000:.1f}ms")
+    if 'rows_scanned' in batch_stats:
+        print(f"  Rows scanned / delivered: {batch_stats['rows_scanned'].sum() / batch_stats['rows_delivered'].sum():.1f}x")
+
+    print(f"\n🔍 Incremental vs full refresh:")
+    for key, value in comparison.items():
+        print(f"  {key}: {value}")
+    print("="*60)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Replay screenings as late/out-of-order micro-batches through fct_screenings."
+    )
+    parser.add_argument('--config', help="YAML config file (reads the 'replay' section)")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--input-path')
+    parser.add_argument('--batch-frequency', help="Pandas offset alias, e.g. 1D or 6h")
+    parser.add_argument('--late-rate', type=float)
+    parser.add_argument('--max-lateness-days', type=int)
+    parser.add_argument('--out-of-order-rate', type=float)
+    parser.add_argument('--lookback-days', type=int)
+    parser.add_argument('--ignore-loaded-at', dest='use_loaded_at', action='store_const', const=False,
+                        help="Evaluate the screening_date lookback on its own")
+    parser.add_argument('--engine', choices=ENGINES)
+    parser.add_argument('--output-dir', help="Write each batch as a CSV")
+    parser.add_argument('--target', help="dbt target (dbt engine only; required, not 'default')")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = vars(parse_args(argv))
+    config = load_config(args.pop('config'), **args)
+
+    try:
+        batch_stats, comparison = run_replay(config)
+    except ValueError as error:
+        print(f"\n❌ Error: {error}")
+        return 1
+    print_summary(batch_stats, comparison, config)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
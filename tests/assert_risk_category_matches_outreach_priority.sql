@@ -0,0 +1,11 @@
+-- risk_category comes from the Python scorer (np.searchsorted) and outreach_priority
+-- from the generated SQL CASE; both read var('risk_tiers'), so every scored row must
+-- land in the same tier on both paths.
+select
+    screening_id,
+    employer_id,
+    predicted_completion_probability,
+    risk_category,
+    outreach_priority
+from {{ ref('mart_followup_risk_prediction') }}
+where risk_category != {{ risk_tier_case('predicted_completion_probability', 'risk_category', 'employer_id') }}
@@ -0,0 +1,22 @@
+-- agg_employer_daily_screening_sketches is incremental; after any sequence of runs every
+-- employer-day must hold the same screening count as fct_screenings (days a screening moved
+-- out of included, which the model zeroes rather than deletes).
+with sketches as (
+    select employer_id, screening_date, total_screenings
+    from {{ ref('agg_employer_daily_screening_sketches') }}
+),
+
+fct_counts as (
+    select employer_id, screening_date, count(*) as total_screenings
+    from {{ ref('fct_screenings') }}
+    group by employer_id, screening_date
+)
+
+select
+    employer_id,
+    screening_date,
+    s.total_screenings as sketch_screenings,
+    c.total_screenings as fct_screenings
+from sketches s
+full outer join fct_counts c using (employer_id, screening_date)
+where coalesce(s.total_screenings, 0) != coalesce(c.total_screenings, 0)